@@ -0,0 +1,16 @@
+"""Gunicorn production config for uvpy.run.
+
+Every route is file I/O (metadata reads, script delivery), so threaded
+workers let concurrent requests overlap on disk instead of serializing
+behind one thread per worker. Keepalive avoids a TCP handshake per asset
+behind the Cloudflare Tunnel.
+"""
+
+import multiprocessing
+
+bind = "0.0.0.0:9999"
+workers = multiprocessing.cpu_count() * 2 + 1
+worker_class = "gthread"
+threads = 4
+worker_connections = 1000
+keepalive = 5
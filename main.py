@@ -1,9 +1,14 @@
+import hashlib
 import os
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from xml.sax.saxutils import escape
 
-from flask import Flask, Response, redirect, request
+from flask import Flask, Response, g, redirect, request
 from flask import send_from_directory
-from flask import render_template_string, render_template
+from flask import render_template
+from jinja2 import FileSystemBytecodeCache
 
 from dotenv import load_dotenv
 from tool_metadata import build_remote_usage_examples, parse_tool_metadata
@@ -12,6 +17,11 @@ _ = load_dotenv()
 
 FLASK_SECRET = os.environ.get("FLASK_SECRET")
 FORCE_HTTPS = os.environ.get("FORCE_HTTPS", "false").lower() == "true"
+# Set when a reverse proxy in front of Gunicorn adds the security headers
+# itself, so Python stops re-writing them on every response.
+SECURITY_HEADERS_AT_PROXY = (
+    os.environ.get("SECURITY_HEADERS_AT_PROXY", "false").lower() == "true"
+)
 
 
 STATIC_PYFILES_ROOT = "./static_pyfiles/"
@@ -27,16 +37,29 @@ LEGACY_SCRIPT_ALIASES = {
     "imgtr.py": "image.py",
     "imgtrans.py": "image.py",
 }
+JINJA_BYTECODE_CACHE_DIR = ".jinja_cache"
+
+# Hosted scripts change more often than visual assets, so they get a
+# shorter client cache; conditional requests still short-circuit to 304.
+ASSET_MAX_AGE_SECONDS = 3600
+SCRIPT_MAX_AGE_SECONDS = 300
 
 app = Flask(__name__)
 app.secret_key = FLASK_SECRET
-
-
-@app.after_request
-def add_security_headers(response):
-    """Add security headers to all responses"""
-    # Content Security Policy
-    response.headers['Content-Security-Policy'] = (
+# Persist compiled templates so each Gunicorn worker boot skips the Jinja
+# parse+compile step for list_tools.html / script_detail.html.
+os.makedirs(JINJA_BYTECODE_CACHE_DIR, exist_ok=True)
+app.jinja_env.bytecode_cache = FileSystemBytecodeCache(JINJA_BYTECODE_CACHE_DIR)
+# Werkzeug's send_file delegates to environ['wsgi.file_wrapper'] (kernel
+# sendfile under supporting WSGI servers); a max-age default adds the
+# Cache-Control/304 side of that path for everything in static/.
+app.config["SEND_FILE_MAX_AGE_DEFAULT"] = ASSET_MAX_AGE_SECONDS
+
+
+# Built once at import; the per-response work is a single headers.update
+# plus the HSTS conditional.
+_STATIC_SECURITY_HEADERS = {
+    'Content-Security-Policy': (
         "default-src 'self'; "
         "script-src 'self' 'unsafe-inline'; "
         "style-src 'self' 'unsafe-inline'; "
@@ -46,18 +69,26 @@ def add_security_headers(response):
         "frame-ancestors 'none'; "
         "base-uri 'self'; "
         "form-action 'self'"
-    )
-    
-    # Other security headers
-    response.headers['X-Content-Type-Options'] = 'nosniff'
-    response.headers['X-Frame-Options'] = 'DENY'
-    response.headers['X-XSS-Protection'] = '1; mode=block'
-    response.headers['Referrer-Policy'] = 'strict-origin-when-cross-origin'
-    
+    ),
+    'X-Content-Type-Options': 'nosniff',
+    'X-Frame-Options': 'DENY',
+    'X-XSS-Protection': '1; mode=block',
+    'Referrer-Policy': 'strict-origin-when-cross-origin',
+}
+
+
+@app.after_request
+def add_security_headers(response):
+    """Add security headers to all responses"""
+    if SECURITY_HEADERS_AT_PROXY:
+        return response
+
+    response.headers.update(_STATIC_SECURITY_HEADERS)
+
     # HSTS for HTTPS (only add if using HTTPS)
     if request.is_secure or request.headers.get('X-Forwarded-Proto') == 'https':
         response.headers['Strict-Transport-Security'] = 'max-age=31536000; includeSubDomains'
-    
+
     return response
 
 
@@ -65,26 +96,23 @@ def get_base_url():
     """
     动态获取基础URL，根据环境自动选择HTTP或HTTPS
     本地预览使用HTTP，生产环境或未知域名时使用HTTPS
+    结果缓存在 flask.g，同一请求内重复调用不再重新判断
     """
-    # 如果强制使用HTTPS
-    if FORCE_HTTPS:
-        protocol = 'https'
-    # 检查是否是本地地址。gunicorn 本地预览不是 debug 模式，也应使用 HTTP。
-    elif is_local_request_host():
+    base_url = g.get('base_url')
+    if base_url is not None:
+        return base_url
+
+    # 只有本地地址使用HTTP（gunicorn 本地预览不是 debug 模式，也应使用 HTTP）。
+    # 其余情况——强制HTTPS、代理转发、未知域名——最终都使用HTTPS，
+    # 所以不需要逐个检查 X-Forwarded-* 请求头。
+    if not FORCE_HTTPS and is_local_request_host():
         protocol = 'http'
     else:
-        # 检查请求头中的协议信息（代理服务器设置）
-        if request.headers.get('X-Forwarded-Proto') == 'https':
-            protocol = 'https'
-        elif request.headers.get('X-Forwarded-Ssl') == 'on':
-            protocol = 'https'
-        elif request.is_secure:
-            protocol = 'https'
-        else:
-            # 默认使用HTTPS，特别是对于未知域名
-            protocol = 'https'
-    
-    return f"{protocol}://{request.host}"
+        protocol = 'https'
+
+    base_url = f"{protocol}://{request.host}"
+    g.base_url = base_url
+    return base_url
 
 
 def is_local_request_host():
@@ -112,14 +140,74 @@ def get_canonical_url(path=None):
     return f"{CANONICAL_BASE_URL}{path or request.path}"
 
 
+# Sorted tool filename cache: (directory mtime_ns, filenames). The mtime
+# is revalidated at most once per TOOL_LISTING_REVALIDATE_SECONDS, so most
+# requests serve the listing without any syscall.
+TOOL_LISTING_REVALIDATE_SECONDS = 1.0
+_TOOL_LISTING_CACHE = (None, [])
+_TOOL_LISTING_CHECKED_AT = 0.0
+
+
 def iter_public_python_tools():
-    """Yield public Python tool filenames and filesystem paths."""
-    if not os.path.exists(STATIC_PYFILES_ROOT):
-        return
+    """Yield public Python tool filenames and filesystem paths.
+
+    The sorted listing is cached on the directory mtime so unchanged
+    catalogs skip the directory scan.
+    """
+    global _TOOL_LISTING_CACHE, _TOOL_LISTING_CHECKED_AT
+
+    now = time.monotonic()
+    if (
+        _TOOL_LISTING_CACHE[0] is None
+        or now - _TOOL_LISTING_CHECKED_AT >= TOOL_LISTING_REVALIDATE_SECONDS
+    ):
+        _TOOL_LISTING_CHECKED_AT = now
+        try:
+            directory_mtime = os.stat(STATIC_PYFILES_ROOT).st_mtime_ns
+        except OSError:
+            _TOOL_LISTING_CACHE = (None, [])
+            return
+
+        if _TOOL_LISTING_CACHE[0] != directory_mtime:
+            # Unbound-method alias avoids the per-entry attribute lookup
+            is_py = str.endswith
+            with os.scandir(STATIC_PYFILES_ROOT) as entries:
+                filenames = sorted(
+                    entry.name
+                    for entry in entries
+                    if is_py(entry.name, ".py") and entry.is_file()
+                )
+            _TOOL_LISTING_CACHE = (directory_mtime, filenames)
+
+    for filename in _TOOL_LISTING_CACHE[1]:
+        yield filename, os.path.join(STATIC_PYFILES_ROOT, filename)
+
+
+# Overlaps cold metadata reads on disk; warm requests hit the parse cache
+# and the pool is effectively free.
+_METADATA_POOL = ThreadPoolExecutor(max_workers=8, thread_name_prefix="tool-parse")
+
+
+def parse_public_tool_metadata(tools):
+    """Parse metadata dicts for (filename, path) pairs with parallel reads."""
+    return list(
+        _METADATA_POOL.map(
+            lambda item: parse_tool_metadata(item[1]).to_dict(),
+            tools,
+        )
+    )
+
+
+def warm_tool_caches():
+    """Parse the whole catalog at startup so the first request is warm.
+
+    The mtime keys on the listing and metadata caches take the place of a
+    filesystem watcher: a changed file rotates its key on the next request.
+    """
+    parse_public_tool_metadata(list(iter_public_python_tools()))
 
-    for filename in sorted(os.listdir(STATIC_PYFILES_ROOT)):
-        if filename.endswith(".py"):
-            yield filename, os.path.join(STATIC_PYFILES_ROOT, filename)
+
+warm_tool_caches()
 
 
 def build_primary_run_command(file_info, base_url, filename):
@@ -145,48 +233,107 @@ html_file_not_found = f"""
 """
 
 
+def file_not_found_response():
+    """Return the static 404 page without a per-request template compile."""
+    return Response(html_file_not_found, status=404, mimetype="text/html")
+
+
+def error_response(heading, message):
+    """Return a 500 page without routing the baked-in text through Jinja."""
+    error_html = f"""
+    <html>
+    <head><title>Error</title></head>
+    <body>
+        <h1>{heading}</h1>
+        <p>{message}</p>
+    </body>
+    </html>
+    """
+    return Response(error_html, status=500, mimetype="text/html")
+
+
+# robots.txt never changes at runtime; load it once at import.
+try:
+    with open("robots.txt", "rb") as _robots_file:
+        _ROBOTS_BODY = _robots_file.read()
+except OSError:
+    _ROBOTS_BODY = None
+
+
 @app.route("/robots.txt")
 def robots_txt():
-    """Serve robots.txt file"""
-    return send_from_directory(".", "robots.txt")
+    """Serve robots.txt from the copy loaded at import"""
+    if _ROBOTS_BODY is None:
+        return file_not_found_response()
+
+    response = Response(_ROBOTS_BODY, mimetype="text/plain")
+    response.cache_control.public = True
+    response.cache_control.max_age = 86400
+    return response
+
+
+# Generated sitemap cache: (catalog key, xml body).
+_SITEMAP_CACHE = (None, None)
 
 
 @app.route("/sitemap.xml")
 def sitemap_xml():
     """Serve a sitemap generated from the current public tool catalog."""
-    entries = [
-        {
-            "loc": get_canonical_url("/"),
-            "changefreq": "weekly",
-            "priority": "1.0",
-        }
-    ]
+    global _SITEMAP_CACHE
 
-    for filename, file_path in iter_public_python_tools():
-        script_slug = filename[:-3]
-        file_info = parse_tool_metadata(file_path).to_dict()
-        entries.append(
+    try:
+        tools = list(iter_public_python_tools())
+        catalog_key = tool_catalog_etag(tools, CANONICAL_BASE_URL)
+        if _SITEMAP_CACHE[0] == catalog_key:
+            return Response(_SITEMAP_CACHE[1], mimetype="application/xml")
+
+        entries = [
             {
-                "loc": get_canonical_url(f"/detail/{script_slug}"),
-                "lastmod": file_info["updated_at"],
-                "changefreq": "monthly",
-                "priority": "0.8",
+                "loc": get_canonical_url("/"),
+                "changefreq": "weekly",
+                "priority": "1.0",
             }
+        ]
+
+        for filename, file_path in tools:
+            script_slug = filename[:-3]
+            file_info = parse_tool_metadata(file_path).to_dict()
+            entries.append(
+                {
+                    "loc": get_canonical_url(f"/detail/{script_slug}"),
+                    "lastmod": file_info["updated_at"],
+                    "changefreq": "monthly",
+                    "priority": "0.8",
+                }
+            )
+
+        lines = ['<?xml version="1.0" encoding="UTF-8"?>']
+        lines.append('<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">')
+        for entry in entries:
+            lines.append("    <url>")
+            lines.append(f"        <loc>{escape(entry['loc'])}</loc>")
+            if entry.get("lastmod") and entry["lastmod"] != "N/A":
+                lines.append(f"        <lastmod>{escape(entry['lastmod'])}</lastmod>")
+            lines.append(f"        <changefreq>{entry['changefreq']}</changefreq>")
+            lines.append(f"        <priority>{entry['priority']}</priority>")
+            lines.append("    </url>")
+        lines.append("</urlset>")
+
+        body = "\n".join(lines) + "\n"
+        _SITEMAP_CACHE = (catalog_key, body)
+        return Response(body, mimetype="application/xml")
+
+    except Exception as e:
+        return error_response(
+            "Error generating sitemap",
+            f"An error occurred while generating the sitemap: {e}",
         )
 
-    lines = ['<?xml version="1.0" encoding="UTF-8"?>']
-    lines.append('<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">')
-    for entry in entries:
-        lines.append("    <url>")
-        lines.append(f"        <loc>{escape(entry['loc'])}</loc>")
-        if entry.get("lastmod") and entry["lastmod"] != "N/A":
-            lines.append(f"        <lastmod>{escape(entry['lastmod'])}</lastmod>")
-        lines.append(f"        <changefreq>{entry['changefreq']}</changefreq>")
-        lines.append(f"        <priority>{entry['priority']}</priority>")
-        lines.append("    </url>")
-    lines.append("</urlset>")
 
-    return Response("\n".join(lines) + "\n", mimetype="application/xml")
+# Rendered detail pages keyed by (script name, mtime, base URL) with LRU
+# eviction; repeat hits skip the parse and the Jinja render.
+_DETAIL_RENDER_CACHE = OrderedDict()
+_DETAIL_RENDER_CACHE_MAX_ENTRIES = 256
 
 
 @app.route("/detail/<script_name>")
@@ -200,18 +347,26 @@ def script_detail(script_name):
         if script_name in LEGACY_SCRIPT_ALIASES:
             canonical_name = LEGACY_SCRIPT_ALIASES[script_name]
             return redirect(f'/detail/{canonical_name[:-3]}', code=301)
-        
+
         file_path = os.path.join(STATIC_PYFILES_ROOT, script_name)
-        
-        # Check if file exists
-        if not os.path.exists(file_path):
-            return render_template_string(html_file_not_found), 404
-        
-        # Extract detailed information from the file
-        file_info = parse_tool_metadata(file_path).to_dict()
-        
+
+        # One stat doubles as the existence check and the parse-cache key
+        try:
+            file_stat = os.stat(file_path)
+        except OSError:
+            return file_not_found_response()
+
         # Get the base URL with correct protocol
         base_url = get_base_url()
+
+        cache_key = (script_name, file_stat.st_mtime_ns, base_url)
+        rendered = _DETAIL_RENDER_CACHE.get(cache_key)
+        if rendered is not None:
+            _DETAIL_RENDER_CACHE.move_to_end(cache_key)
+            return rendered
+
+        # Extract detailed information from the file
+        file_info = parse_tool_metadata(file_path, file_stat).to_dict()
         script_slug = script_name[:-3]
         canonical_url = get_canonical_url(f"/detail/{script_slug}")
         raw_source_url = get_canonical_url(f"/{script_name}")
@@ -249,37 +404,41 @@ def script_detail(script_name):
         }
         
         # Use detail template
-        return render_template('script_detail.html',
+        rendered = render_template('script_detail.html',
                              script_info=file_info,
                              base_url=base_url,
                              canonical_url=canonical_url,
                              structured_data=structured_data,
                              open_source_url=OPEN_SOURCE_URL,
                              script_name=script_name)
-        
+
+        _DETAIL_RENDER_CACHE[cache_key] = rendered
+        if len(_DETAIL_RENDER_CACHE) > _DETAIL_RENDER_CACHE_MAX_ENTRIES:
+            _DETAIL_RENDER_CACHE.popitem(last=False)
+        return rendered
+
+
     except Exception as e:
-        error_html = f"""
-        <html>
-        <head><title>Error</title></head>
-        <body>
-            <h1>Error loading script details</h1>
-            <p>An error occurred while loading script details: {str(e)}</p>
-        </body>
-        </html>
-        """
-        return render_template_string(error_html), 500
+        return error_response(
+            "Error loading script details",
+            f"An error occurred while loading script details: {e}",
+        )
 
 
 @app.route("/<filename>")
 def server_pyfiles(filename: str):
     if not filename.endswith('.py'):
-        return render_template_string(html_file_not_found), 404
+        return file_not_found_response()
 
     if filename in LEGACY_SCRIPT_ALIASES:
         return redirect(f'/{LEGACY_SCRIPT_ALIASES[filename]}', code=301)
 
     try:
-        response = send_from_directory(STATIC_PYFILES_ROOT, filename)
+        response = send_from_directory(
+            STATIC_PYFILES_ROOT,
+            filename,
+            max_age=SCRIPT_MAX_AGE_SECONDS,
+        )
         script_slug = filename[:-3]
         response.headers["X-Robots-Tag"] = "noindex, follow"
         response.headers.add(
@@ -288,7 +447,31 @@ def server_pyfiles(filename: str):
         )
         return response
     except FileNotFoundError:
-        return render_template_string(html_file_not_found), 404
+        return file_not_found_response()
+
+
+# Rendered directory HTML keyed by catalog ETag; the key rotates when a
+# tool file or the request origin changes.
+_LIST_RENDER_CACHE = {}
+_LIST_RENDER_CACHE_MAX_ENTRIES = 8
+
+
+def tool_catalog_etag(tools, base_url):
+    """ETag covering the tool directory contents and the request origin."""
+    # The listing may be served stale for up to a second, so a tool that
+    # was renamed or deleted in that window can vanish between the listing
+    # and this stat; fold a sentinel into the digest instead of failing
+    # the whole page, and the key rotates again once the listing catches up.
+    stamps = []
+    for _, file_path in tools:
+        try:
+            stamps.append(str(os.stat(file_path).st_mtime_ns))
+        except OSError:
+            stamps.append("gone")
+    return hashlib.blake2b(
+        f"{base_url}:{':'.join(stamps)}".encode(),
+        digest_size=16,
+    ).hexdigest()
 
 
 @app.route("/")
@@ -296,64 +479,61 @@ def list_tools():
     """List all available Python tools in the static_pyfiles directory."""
     try:
         base_url = get_base_url()
+        tools = list(iter_public_python_tools())
+        catalog_etag = tool_catalog_etag(tools, base_url)
+
+        # Matching clients skip the render and the body bytes entirely
+        if request.if_none_match.contains(catalog_etag):
+            response = Response(status=304)
+            response.set_etag(catalog_etag)
+            return response
+
+        rendered = _LIST_RENDER_CACHE.get(catalog_etag)
+        if rendered is None:
+            rendered = render_tool_directory(tools, base_url)
+            if len(_LIST_RENDER_CACHE) >= _LIST_RENDER_CACHE_MAX_ENTRIES:
+                _LIST_RENDER_CACHE.clear()
+            _LIST_RENDER_CACHE[catalog_etag] = rendered
+
+        response = Response(rendered, mimetype="text/html")
+        response.set_etag(catalog_etag)
+        response.cache_control.max_age = 60
+        return response
 
-        # Get all Python files from the static_pyfiles directory
-        py_files = []
-        if os.path.exists(STATIC_PYFILES_ROOT):
-            for filename in os.listdir(STATIC_PYFILES_ROOT):
-                if filename.endswith('.py'):
-                    file_path = os.path.join(STATIC_PYFILES_ROOT, filename)
-                    
-                    # Extract structured information from the file
-                    file_info = parse_tool_metadata(file_path).to_dict()
-                    run_command = build_primary_run_command(file_info, base_url, filename)
-                    
-                    py_files.append({
-                        'filename': filename,
-                        'title': file_info['title'],
-                        'description': file_info['description'],
-                        'overview': file_info['overview'],
-                        'version': file_info['version'],
-                        'category': file_info['category'],
-                        'author': file_info['author'],
-                        'requires_python': file_info['requires_python'],
-                        'dependency_count': len(file_info['dependencies']),
-                        'source_lines': file_info['source_lines'],
-                        'updated_at': file_info['updated_at'],
-                        'run_command': run_command,
-                        'url': f'/{filename}',
-                        'detail_url': f'/detail/{filename.replace(".py", "")}'
-                    })
-        
-        # Sort files alphabetically
-        py_files.sort(key=lambda x: x['filename'])
-        categories = sorted({
-            tool['category']
-            for tool in py_files
-            if tool['category'] and tool['category'] != 'N/A'
-        })
-        
-        # Use external HTML template with base_url context
-        return render_template(
-            'list_tools.html',
-            tools=py_files,
-            categories=categories,
-            base_url=base_url,
-            canonical_url=get_canonical_url("/"),
-            open_source_url=OPEN_SOURCE_URL,
-        )
-        
     except Exception as e:
-        error_html = f"""
-        <html>
-        <head><title>Error</title></head>
-        <body>
-            <h1>Error listing tools</h1>
-            <p>An error occurred while listing the available tools: {str(e)}</p>
-        </body>
-        </html>
-        """
-        return render_template_string(error_html), 500
+        return error_response(
+            "Error listing tools",
+            f"An error occurred while listing the available tools: {e}",
+        )
+
+
+def render_tool_directory(tools, base_url):
+    """Render the directory page HTML for the current tool catalog."""
+    # Each file_info is a fresh to_dict() copy, so the rows extend it in
+    # place with the listing-only fields instead of re-copying every value
+    # into a second dict per tool. Categories are collected in the same
+    # pass, and the template iterates the metadata list directly.
+    file_infos = parse_public_tool_metadata(tools)
+    categories = set()
+    for (filename, file_path), file_info in zip(tools, file_infos):
+        file_info['dependency_count'] = len(file_info['dependencies'])
+        file_info['run_command'] = build_primary_run_command(
+            file_info, base_url, filename
+        )
+        file_info['url'] = f'/{filename}'
+        file_info['detail_url'] = f'/detail/{filename.replace(".py", "")}'
+        if file_info['category'] and file_info['category'] != 'N/A':
+            categories.add(file_info['category'])
+
+    # Use external HTML template with base_url context
+    return render_template(
+        'list_tools.html',
+        tools=file_infos,
+        categories=sorted(categories),
+        base_url=base_url,
+        canonical_url=get_canonical_url("/"),
+        open_source_url=OPEN_SOURCE_URL,
+    )
 
 
 if __name__ == "__main__":
@@ -82,6 +82,7 @@ import subprocess
 import sys
 import tempfile
 import threading
+import time
 import tkinter as tk
 import wave
 from dataclasses import dataclass
@@ -130,14 +131,6 @@ ROW_COLORS = [
     "#5bf0ff",
 ]
 
-SPECIAL_TYPES = [
-    "multi_ball",
-    "speed_up",
-    "expand_paddle",
-    "extra_life",
-    "bonus_score",
-]
-
 
 class BrickType(Enum):
     """Types of bricks and their catchable power-up drops."""
@@ -150,6 +143,16 @@ class BrickType(Enum):
     BONUS_SCORE = "bonus_score"
 
 
+# Tuple of the special drop types; built once so brick generation does not
+# rebuild a list of enum members per brick.
+_SPECIAL_BRICK_TYPES = (
+    BrickType.MULTI_BALL,
+    BrickType.SPEED_UP,
+    BrickType.EXPAND_PADDLE,
+    BrickType.EXTRA_LIFE,
+    BrickType.BONUS_SCORE,
+)
+
 BRICK_MARKERS = {
     BrickType.MULTI_BALL: "M",
     BrickType.SPEED_UP: "S",
@@ -193,6 +196,34 @@ SOUND_PROFILES = {
     "game_over": (140, 220),
 }
 
+# Bound once at import; the frame loop hits these every tick and a module
+# global is cheaper to load than a module.attribute chain.
+_random = random.random
+_choice = random.choice
+_sin = math.sin
+_cos = math.cos
+
+# Precomputed unit directions across the launch cone; extra-ball spawns
+# pick one instead of drawing a random angle and calling sin/cos. The
+# angle range matches the +-0.85 clamp in Ball.launch.
+_EXTRA_BALL_DIRS = tuple(
+    (_sin(angle), -abs(_cos(angle)))
+    for angle in (-0.85 + 1.7 * i / 63 for i in range(64))
+)
+
+# Movement keysyms folded to direction bits; frame input tests the mask
+# with bitwise ops instead of hashing strings into a set.
+_LEFT_BIT = 1
+_RIGHT_BIT = 2
+_KEY_BITS = {
+    "Left": _LEFT_BIT,
+    "a": _LEFT_BIT,
+    "A": _LEFT_BIT,
+    "Right": _RIGHT_BIT,
+    "d": _RIGHT_BIT,
+    "D": _RIGHT_BIT,
+}
+
 
 @dataclass(frozen=True)
 class DifficultySettings:
@@ -409,6 +440,9 @@ class Ball:
         self.dx = 0.0
         self.dy = 0.0
         self.stuck_to_paddle = stuck_to_paddle
+        # radius + 5 recomputed per redraw adds up at 60 FPS per ball
+        self.glow_radius = radius + 5
+        self._bounds = (x - radius, y - radius, x + radius, y + radius)
 
         self.glow_id = canvas.create_oval(
             x - radius - 5,
@@ -431,13 +465,27 @@ class Ball:
             tags=("world", "ball"),
         )
 
+    def reset(self, x: float, y: float, stuck_to_paddle: bool = False) -> None:
+        """Re-arm a pooled ball at a new position and show its items."""
+
+        self.dx = 0.0
+        self.dy = 0.0
+        self.stuck_to_paddle = stuck_to_paddle
+        self.set_position(x, y)
+        self.canvas.itemconfig(self.glow_id, state="normal")
+        self.canvas.itemconfig(self.ball_id, state="normal")
+
+    def hide(self) -> None:
+        self.canvas.itemconfig(self.glow_id, state="hidden")
+        self.canvas.itemconfig(self.ball_id, state="hidden")
+
     def launch(self, angle_offset: float = 0.0) -> None:
         """Launch a stuck ball upward with a little controllable variety."""
 
         angle = clamp(angle_offset, -0.85, 0.85)
         speed = self.base_speed
-        self.dx = speed * math.sin(angle)
-        self.dy = -abs(speed * math.cos(angle))
+        self.dx = speed * _sin(angle)
+        self.dy = -abs(speed * _cos(angle))
         self.stuck_to_paddle = False
 
     def move(self) -> None:
@@ -446,11 +494,20 @@ class Ball:
         if self.stuck_to_paddle:
             return
 
+        dx = self.dx
+        dy = self.dy
         self.prev_x = self.x
         self.prev_y = self.y
-        self.x += self.dx
-        self.y += self.dy
-        self.update_position()
+        x = self.x + dx
+        y = self.y + dy
+        self.x = x
+        self.y = y
+        radius = self.radius
+        self._bounds = (x - radius, y - radius, x + radius, y + radius)
+        # canvas.move ships two deltas to Tk instead of four absolute
+        # coordinates per item; the clamp paths still use coords().
+        self.canvas.move(self.glow_id, dx, dy)
+        self.canvas.move(self.ball_id, dx, dy)
 
     def set_position(self, x: float, y: float) -> None:
         """Move the ball without changing velocity."""
@@ -464,19 +521,22 @@ class Ball:
     def update_position(self) -> None:
         """Redraw the ball at its logical coordinates."""
 
+        x, y, radius = self.x, self.y, self.radius
+        glow = self.glow_radius
+        self._bounds = (x - radius, y - radius, x + radius, y + radius)
         self.canvas.coords(
             self.glow_id,
-            self.x - self.radius - 5,
-            self.y - self.radius - 5,
-            self.x + self.radius + 5,
-            self.y + self.radius + 5,
+            x - glow,
+            y - glow,
+            x + glow,
+            y + glow,
         )
         self.canvas.coords(
             self.ball_id,
-            self.x - self.radius,
-            self.y - self.radius,
-            self.x + self.radius,
-            self.y + self.radius,
+            x - radius,
+            y - radius,
+            x + radius,
+            y + radius,
         )
 
     def bounce_x(self) -> None:
@@ -511,12 +571,7 @@ class Ball:
         self.canvas.delete(self.ball_id)
 
     def get_bounds(self) -> tuple[float, float, float, float]:
-        return (
-            self.x - self.radius,
-            self.y - self.radius,
-            self.x + self.radius,
-            self.y + self.radius,
-        )
+        return self._bounds
 
     def get_previous_bounds(self) -> tuple[float, float, float, float]:
         return (
@@ -544,8 +599,20 @@ class Paddle:
         self.y = y
         self.original_width = width
         self.width = width
+        self.half_width = width / 2
         self.height = height
+        self.half_height = height / 2
         self.speed = 13.5 * clamp(speed_multiplier, 0.75, 1.6)
+        # Forces the first update_position() through the absolute path so
+        # the drawn items sync with the fractional logical coordinates.
+        self._drawn_x = x
+        self._drawn_width = -1
+        self._bounds = (
+            x - width / 2,
+            y - height / 2,
+            x + width / 2,
+            y + height / 2,
+        )
         self.glow_id = canvas.create_rectangle(
             x - width // 2 - 4,
             y - height // 2 - 4,
@@ -576,31 +643,49 @@ class Paddle:
             tags=("world", "paddle"),
         )
 
-    def move_left(self) -> None:
-        self.move_by(-self.speed)
-
-    def move_right(self, canvas_width: int) -> None:
-        self.move_by(self.speed, canvas_width)
+    def apply_input(self, direction: int, canvas_width: int = CANVAS_WIDTH) -> None:
+        """Step one frame of keyboard movement with a single clamp."""
 
-    def move_by(self, dx: float, canvas_width: int = CANVAS_WIDTH) -> None:
-        self.move_to(self.x + dx, canvas_width)
+        half = self.half_width
+        self.x = max(half, min(canvas_width - half, self.x + direction * self.speed))
+        self.update_position()
 
     def move_to(self, x: float, canvas_width: int = CANVAS_WIDTH) -> None:
-        half = self.width / 2
+        half = self.half_width
         self.x = clamp(x, half, canvas_width - half)
         self.update_position()
 
     def expand(self, factor: float = 1.45) -> None:
         self.width = min(215, int(self.original_width * factor))
+        self.half_width = self.width / 2
         self.update_position()
 
     def reset_size(self) -> None:
         self.width = self.original_width
+        self.half_width = self.width / 2
         self.update_position()
 
     def update_position(self) -> None:
-        half_width = self.width / 2
-        half_height = self.height / 2
+        half_width = self.half_width
+        half_height = self.half_height
+        self._bounds = (
+            self.x - half_width,
+            self.y - half_height,
+            self.x + half_width,
+            self.y + half_height,
+        )
+        if self.width == self._drawn_width:
+            # Pure horizontal slide: one delta per item is cheaper than
+            # re-sending four absolute coordinates.
+            dx = self.x - self._drawn_x
+            if dx:
+                self.canvas.move(self.glow_id, dx, 0)
+                self.canvas.move(self.paddle_id, dx, 0)
+                self.canvas.move(self.highlight_id, dx, 0)
+                self._drawn_x = self.x
+            return
+        self._drawn_x = self.x
+        self._drawn_width = self.width
         self.canvas.coords(
             self.glow_id,
             self.x - half_width - 4,
@@ -624,12 +709,7 @@ class Paddle:
         )
 
     def get_bounds(self) -> tuple[float, float, float, float]:
-        return (
-            self.x - self.width / 2,
-            self.y - self.height / 2,
-            self.x + self.width / 2,
-            self.y + self.height / 2,
-        )
+        return self._bounds
 
 
 class Brick:
@@ -657,9 +737,17 @@ class Brick:
         self.destroyed = False
         self.color = POWERUP_COLORS.get(brick_type, color)
         self.outline = "#faffff" if brick_type != BrickType.NORMAL else "#1b2838"
+        self.grid_position: tuple[int, int] | None = None
+        # Bricks never move, so the bounds tuple is built exactly once.
+        self._bounds = (x, y, x + width, y + height)
         self.item_ids: list[int] = []
 
-        self.shadow_id = canvas.create_rectangle(
+        # One attribute resolution per method, not per canvas item; this
+        # constructor runs ~100 times per wave.
+        create_rectangle = canvas.create_rectangle
+        create_line = canvas.create_line
+
+        self.shadow_id = create_rectangle(
             x + 3,
             y + 4,
             x + width + 3,
@@ -668,7 +756,7 @@ class Brick:
             outline="",
             tags=("world", "brick"),
         )
-        self.brick_id = canvas.create_rectangle(
+        self.brick_id = create_rectangle(
             x,
             y,
             x + width,
@@ -678,7 +766,7 @@ class Brick:
             width=2,
             tags=("world", "brick"),
         )
-        self.highlight_id = canvas.create_line(
+        self.highlight_id = create_line(
             x + 4,
             y + 4,
             x + width - 4,
@@ -703,7 +791,7 @@ class Brick:
 
         self.armor_id: int | None = None
         if self.max_hit_points > 1:
-            self.armor_id = canvas.create_line(
+            self.armor_id = create_line(
                 x + 7,
                 y + height - 5,
                 x + width - 7,
@@ -726,7 +814,7 @@ class Brick:
             return True
 
         self.canvas.itemconfig(self.brick_id, fill="#2f4053", outline="#ffffff")
-        if self.armor_id:
+        if self.armor_id is not None:
             self.canvas.itemconfig(self.armor_id, fill="#ffdd66")
         return False
 
@@ -738,7 +826,7 @@ class Brick:
         self.destroyed = True
 
     def get_bounds(self) -> tuple[float, float, float, float]:
-        return (self.x, self.y, self.x + self.width, self.y + self.height)
+        return self._bounds
 
     def center(self) -> tuple[float, float]:
         return (self.x + self.width / 2, self.y + self.height / 2)
@@ -776,15 +864,12 @@ class PowerUp:
         )
 
     def move(self, speed_bonus: float = 1.0) -> None:
-        self.y += self.dy * speed_bonus
-        self.canvas.coords(
-            self.token_id,
-            self.x - self.radius,
-            self.y - self.radius,
-            self.x + self.radius,
-            self.y + self.radius,
-        )
-        self.canvas.coords(self.text_id, self.x, self.y)
+        dy = self.dy * speed_bonus
+        self.y += dy
+        # Falling tokens only translate, so a delta move per item beats
+        # re-sending absolute coordinates.
+        self.canvas.move(self.token_id, 0, dy)
+        self.canvas.move(self.text_id, 0, dy)
 
     def destroy(self) -> None:
         self.canvas.delete(self.token_id)
@@ -830,7 +915,7 @@ class BreakoutGame:
         self.canvas.pack()
 
         self.sound = SoundEngine(enabled=sound_enabled, root=self.root)
-        self.pressed_keys: set[str] = set()
+        self.pressed_mask = 0
 
         self.score = 0
         self.high_score = 0
@@ -844,8 +929,13 @@ class BreakoutGame:
         self.shake_frames = 0
         self.shake_magnitude = 0.0
         self.shake_offset = (0.0, 0.0)
+        # Deadline-based pacing: each frame is scheduled relative to the
+        # previous deadline, so slow frames do not accumulate drift.
+        self._frame_period = FRAME_MS / 1000.0
+        self._next_frame_time = 0.0
 
         self.balls: list[Ball] = []
+        self._ball_pool: list[Ball] = []
         self.bricks: list[Brick] = []
         self.powerups: list[PowerUp] = []
         self.particles: list[Particle] = []
@@ -853,6 +943,16 @@ class BreakoutGame:
         self.stars: list[int] = []
         self.overlay_ids: list[int] = []
 
+        # Caught-token effects dispatch on brick type with one dict
+        # lookup instead of walking an elif chain.
+        self._powerup_effects = {
+            BrickType.MULTI_BALL: self._catch_multi_ball,
+            BrickType.SPEED_UP: self._catch_speed_up,
+            BrickType.EXPAND_PADDLE: self._catch_expand_paddle,
+            BrickType.EXTRA_LIFE: self._catch_extra_life,
+            BrickType.BONUS_SCORE: self._catch_bonus_score,
+        }
+
         self._create_background()
         self._create_hud()
         self.restart_game(show_intro=True)
@@ -909,6 +1009,9 @@ class BreakoutGame:
         self.canvas.tag_lower("background")
 
     def _create_hud(self) -> None:
+        # Last text drawn per HUD item; update_ui only reconfigures items
+        # whose value actually changed.
+        self._drawn_ui_text: dict[int, str] = {}
         self.score_text = self.canvas.create_text(
             18,
             20,
@@ -987,6 +1090,8 @@ class BreakoutGame:
 
         self.canvas.delete("world")
         self.balls = []
+        # Pooled items were tagged "world" and just got deleted with it.
+        self._ball_pool = []
         self.bricks = []
         self.powerups = []
         self.particles = []
@@ -1004,17 +1109,42 @@ class BreakoutGame:
 
     def prepare_launch_ball(self) -> None:
         for ball in self.balls:
-            ball.destroy()
+            self._release_ball(ball)
         self.balls = [
-            Ball(
-                self.canvas,
+            self._acquire_ball(
                 self.paddle.x,
                 self.paddle.y - START_BALL_Y_OFFSET,
-                speed_multiplier=self.settings.speed_multiplier * self.wave_speed(),
                 stuck_to_paddle=True,
             )
         ]
 
+    def _acquire_ball(self, x: float, y: float, stuck_to_paddle: bool = False) -> Ball:
+        """Reuse a pooled ball when one is available, else build one.
+
+        Reuse skips the Tk item allocation of two create_oval calls. The
+        pool never crosses a wave boundary, so the speed multiplier baked
+        into a pooled ball is always current.
+        """
+
+        if self._ball_pool:
+            ball = self._ball_pool.pop()
+            ball.reset(x, y, stuck_to_paddle)
+            return ball
+        return Ball(
+            self.canvas,
+            x,
+            y,
+            speed_multiplier=self.settings.speed_multiplier * self.wave_speed(),
+            stuck_to_paddle=stuck_to_paddle,
+        )
+
+    def _release_ball(self, ball: Ball) -> None:
+        if len(self._ball_pool) < MAX_BALLS:
+            ball.hide()
+            self._ball_pool.append(ball)
+        else:
+            ball.destroy()
+
     def create_bricks(self) -> None:
         """Create a centered matrix with specials and light wave variation."""
 
@@ -1026,28 +1156,81 @@ class BreakoutGame:
         start_x = (CANVAS_WIDTH - (cols * brick_width + (cols - 1) * gap)) / 2
         start_y = 78
 
+        # The matrix is regular, so collisions can index straight into a
+        # grid cell instead of scanning every brick.
+        self.grid_rows = rows
+        self.grid_cols = cols
+        self.brick_start_x = start_x
+        self.brick_start_y = start_y
+        self.brick_cell_width = brick_width + gap
+        self.brick_cell_height = brick_height + gap
+        self.brick_grid: list[list[Brick | None]] = [
+            [None] * cols for _ in range(rows)
+        ]
+
+        # Hoisted lookups for the rows*cols construction loop; the row
+        # color and y coordinate are per-row constants.
+        canvas = self.canvas
+        is_gap = self._is_gap_in_wave_pattern
+        bricks_append = self.bricks.append
+        cell_width = brick_width + gap
+        armored_row = self.level >= 2
+
         for row in range(rows):
+            row_types = self._random_brick_types_for_row(row, cols)
+            grid_row = self.brick_grid[row]
+            y = start_y + row * (brick_height + gap)
+            color = ROW_COLORS[(row + self.level - 1) % len(ROW_COLORS)]
             for col in range(cols):
-                if self._is_gap_in_wave_pattern(row, col):
+                if is_gap(row, col):
                     continue
 
-                x = start_x + col * (brick_width + gap)
-                y = start_y + row * (brick_height + gap)
-                brick_type = self._get_random_brick_type(row)
-                color = ROW_COLORS[(row + self.level - 1) % len(ROW_COLORS)]
-                hit_points = 2 if self.level >= 2 and row == 0 and col % 2 == 0 else 1
-                self.bricks.append(
-                    Brick(
-                        self.canvas,
-                        x,
-                        y,
-                        brick_width,
-                        brick_height,
-                        brick_type,
-                        color,
-                        hit_points=hit_points,
-                    )
+                x = start_x + col * cell_width
+                hit_points = 2 if armored_row and row == 0 and col % 2 == 0 else 1
+                brick = Brick(
+                    canvas,
+                    x,
+                    y,
+                    brick_width,
+                    brick_height,
+                    row_types[col],
+                    color,
+                    hit_points=hit_points,
                 )
+                brick.grid_position = (row, col)
+                grid_row[col] = brick
+                bricks_append(brick)
+
+        # O(1) win check; handle_brick_collision decrements this.
+        self.remaining_bricks = len(self.bricks)
+        self._recompute_bricks_aabb()
+
+    def _recompute_bricks_aabb(self) -> None:
+        """Refresh the bounding rect of the still-alive bricks.
+
+        Balls spend most of the game below the brick field; one rect test
+        against this box skips the per-brick work entirely down there.
+        """
+
+        self._bricks_aabb_dirty = False
+        self.bricks_aabb = None
+        for grid_row in self.brick_grid:
+            for brick in grid_row:
+                if brick is None:
+                    continue
+                left, top, right, bottom = brick.get_bounds()
+                if self.bricks_aabb is None:
+                    self.bricks_aabb = [left, top, right, bottom]
+                else:
+                    aabb = self.bricks_aabb
+                    if left < aabb[0]:
+                        aabb[0] = left
+                    if top < aabb[1]:
+                        aabb[1] = top
+                    if right > aabb[2]:
+                        aabb[2] = right
+                    if bottom > aabb[3]:
+                        aabb[3] = bottom
 
     def _is_gap_in_wave_pattern(self, row: int, col: int) -> bool:
         if self.level == 1:
@@ -1058,13 +1241,18 @@ class BreakoutGame:
             return (row + col) % 11 == 0
         return False
 
-    def _get_random_brick_type(self, row: int) -> BrickType:
+    def _random_brick_types_for_row(self, row: int, cols: int) -> list[BrickType]:
+        """Draw the whole row's brick types with one weighted RNG call."""
+
         chance = self.settings.special_chance
         if row <= 1:
             chance *= 0.75
-        if random.random() >= chance:
-            return BrickType.NORMAL
-        return BrickType(random.choice(SPECIAL_TYPES))
+        special_weight = chance / len(_SPECIAL_BRICK_TYPES)
+        return random.choices(
+            (BrickType.NORMAL, *_SPECIAL_BRICK_TYPES),
+            weights=(1.0 - chance, *([special_weight] * len(_SPECIAL_BRICK_TYPES))),
+            k=cols,
+        )
 
     def wave_speed(self) -> float:
         return WAVE_SPEED_BONUS ** (self.level - 1)
@@ -1090,12 +1278,14 @@ class BreakoutGame:
             self._clear_overlay()
             self._launch_stuck_balls()
             self._set_mode(MODE_PLAYING)
+            self._next_frame_time = time.monotonic()
             self.game_loop()
             return
 
         if self.mode == MODE_PAUSED:
             self._clear_overlay()
             self._set_mode(MODE_PLAYING)
+            self._next_frame_time = time.monotonic()
             self.game_loop()
 
     def _launch_stuck_balls(self) -> None:
@@ -1113,7 +1303,7 @@ class BreakoutGame:
             self.start_game()
 
     def on_key_press(self, event) -> None:
-        self.pressed_keys.add(event.keysym)
+        self.pressed_mask |= _KEY_BITS.get(event.keysym, 0)
 
         if event.keysym == "space":
             self.start_game()
@@ -1125,7 +1315,7 @@ class BreakoutGame:
             self.root.destroy()
 
     def on_key_release(self, event) -> None:
-        self.pressed_keys.discard(event.keysym)
+        self.pressed_mask &= ~_KEY_BITS.get(event.keysym, 0)
 
     def on_mouse_move(self, event) -> None:
         if self.mode not in {MODE_PLAYING, MODE_READY}:
@@ -1137,10 +1327,11 @@ class BreakoutGame:
         if self.mode not in {MODE_PLAYING, MODE_READY}:
             return
 
-        if "Left" in self.pressed_keys or "a" in self.pressed_keys or "A" in self.pressed_keys:
-            self.paddle.move_left()
-        if "Right" in self.pressed_keys or "d" in self.pressed_keys or "D" in self.pressed_keys:
-            self.paddle.move_right(CANVAS_WIDTH)
+        mask = self.pressed_mask
+        if mask:
+            direction = bool(mask & _RIGHT_BIT) - bool(mask & _LEFT_BIT)
+            if direction:
+                self.paddle.apply_input(direction, CANVAS_WIDTH)
 
         self._update_stuck_balls()
 
@@ -1158,9 +1349,7 @@ class BreakoutGame:
         self._update_timers()
         self._twinkle_stars()
 
-        for ball in self.balls[:]:
-            ball.move()
-            self.check_ball_collisions(ball)
+        self._step_balls()
 
         self.update_powerups()
         self.update_effects()
@@ -1171,7 +1360,14 @@ class BreakoutGame:
             return
 
         self.apply_screen_shake()
-        self.root.after(FRAME_MS, self.game_loop)
+        self._next_frame_time += self._frame_period
+        delay_ms = int((self._next_frame_time - time.monotonic()) * 1000)
+        if delay_ms <= 0:
+            # The frame overran its slot; reschedule immediately and
+            # rebase the deadline so we do not chase an old backlog.
+            self._next_frame_time = time.monotonic()
+            delay_ms = 1
+        self.root.after(delay_ms, self.game_loop)
 
     def _update_timers(self) -> None:
         if self.combo_timer > 0:
@@ -1186,51 +1382,118 @@ class BreakoutGame:
                 self._update_stuck_balls()
 
     def _twinkle_stars(self) -> None:
-        if random.random() > 0.22 or not self.stars:
+        if _random() > 0.22 or not self.stars:
             return
-        star_id = random.choice(self.stars)
+        star_id = _choice(self.stars)
         self.canvas.itemconfig(
             star_id,
-            fill=random.choice(("#275a66", "#3a7d88", "#6bdff0", "#1e4556")),
+            fill=_choice(("#275a66", "#3a7d88", "#6bdff0", "#1e4556")),
         )
 
-    def check_ball_collisions(self, ball: Ball) -> None:
+    def _step_balls(self) -> None:
+        """Advance and collide every ball in one pass.
+
+        The per-frame invariants (paddle bounds, brick-field rect, the
+        sound callable) are resolved once here rather than per ball. A
+        destroyed edge brick marks the rect dirty mid-frame; later balls
+        then test against the old, slightly larger rect, which is only
+        ever conservative, and the next frame recomputes it.
+        """
+
+        if self._bricks_aabb_dirty:
+            self._recompute_bricks_aabb()
+        paddle = self.paddle
+        paddle_bounds = paddle.get_bounds()
+        sound_play = self.sound.play
+        check_ball_collisions = self.check_ball_collisions
+        # Nothing mutates self.balls during the pass (lost balls are
+        # culled afterwards by remove_out_of_bounds_balls), so iterating
+        # the live list avoids a copy per frame.
+        for ball in self.balls:
+            ball.move()
+            check_ball_collisions(ball, paddle, paddle_bounds, sound_play)
+
+    def check_ball_collisions(
+        self,
+        ball: Ball,
+        paddle: Paddle,
+        paddle_bounds: tuple[float, float, float, float],
+        sound_play,
+    ) -> None:
         bounds = ball.get_bounds()
 
         if bounds[0] <= 0:
             ball.x = ball.radius
             ball.bounce_x()
-            self.sound.play("wall")
+            ball.update_position()
+            sound_play("wall")
         elif bounds[2] >= CANVAS_WIDTH:
             ball.x = CANVAS_WIDTH - ball.radius
             ball.bounce_x()
-            self.sound.play("wall")
+            ball.update_position()
+            sound_play("wall")
 
         if bounds[1] <= 48:
             ball.y = 48 + ball.radius
             ball.bounce_y()
-            self.sound.play("wall")
+            ball.update_position()
+            sound_play("wall")
 
-        paddle_bounds = self.paddle.get_bounds()
         if ball.dy > 0 and self.check_collision(ball.get_bounds(), paddle_bounds):
             ball.y = paddle_bounds[1] - ball.radius - 1
             ball.dy = -abs(ball.dy)
-            hit_pos = (ball.x - self.paddle.x) / (self.paddle.width / 2)
+            hit_pos = (ball.x - paddle.x) / (paddle.width / 2)
             speed = clamp(math.hypot(ball.dx, ball.dy) * 1.012, MIN_BALL_SPEED, MAX_BALL_SPEED)
             ball.dx = clamp(hit_pos, -1.0, 1.0) * speed * 0.82
             ball.dy = -math.sqrt(max(MIN_BALL_SPEED, speed * speed - ball.dx * ball.dx))
             ball.update_position()
-            self.spawn_particles(ball.x, self.paddle.y - 8, PADDLE_FILL, 8)
-            self.sound.play("paddle")
-
-        for brick in self.bricks[:]:
-            if brick.destroyed:
-                continue
-            if self.check_collision(ball.get_bounds(), brick.get_bounds()):
+            self.spawn_particles(ball.x, paddle.y - 8, PADDLE_FILL, 8)
+            sound_play("paddle")
+
+        # The brick test runs for every candidate each frame, so the AABB
+        # check is inlined with unpacked locals instead of going through
+        # check_collision; x mismatches short-circuit first because most
+        # candidates fail on that axis.
+        aabb = self.bricks_aabb
+        if aabb is None:
+            return
+        bl, bt, br, bb = ball.get_bounds()
+        if bb < aabb[1] or bt > aabb[3] or br < aabb[0] or bl > aabb[2]:
+            return
+        for brick in self._bricks_near((bl, bt, br, bb)):
+            brl, brt, brr, brb = brick.get_bounds()
+            if br > brl and bl < brr and bb > brt and bt < brb:
                 self.resolve_brick_bounce(ball, brick)
                 self.handle_brick_collision(brick)
                 break
 
+    def _bricks_near(self, bounds: tuple[float, float, float, float]) -> list[Brick]:
+        """Return live bricks in the (at most 2x2) grid window under bounds."""
+
+        first_col = int((bounds[0] - self.brick_start_x) // self.brick_cell_width)
+        last_col = int((bounds[2] - self.brick_start_x) // self.brick_cell_width)
+        first_row = int((bounds[1] - self.brick_start_y) // self.brick_cell_height)
+        last_row = int((bounds[3] - self.brick_start_y) // self.brick_cell_height)
+
+        if last_col < 0 or first_col >= self.grid_cols:
+            return []
+        if last_row < 0 or first_row >= self.grid_rows:
+            return []
+
+        first_col = max(first_col, 0)
+        last_col = min(last_col, self.grid_cols - 1)
+        first_row = max(first_row, 0)
+        last_row = min(last_row, self.grid_rows - 1)
+
+        candidates = []
+        for row in range(first_row, last_row + 1):
+            grid_row = self.brick_grid[row]
+            for col in range(first_col, last_col + 1):
+                brick = grid_row[col]
+                if brick is not None:
+                    candidates.append(brick)
+        return candidates
+
     def resolve_brick_bounce(self, ball: Ball, brick: Brick) -> None:
         previous = ball.get_previous_bounds()
         left, top, right, bottom = brick.get_bounds()
@@ -1254,7 +1517,22 @@ class BreakoutGame:
             self.sound.play("wall")
             return
 
-        self.bricks.remove(brick)
+        self.remaining_bricks -= 1
+        if brick.grid_position is not None:
+            grid_row, grid_col = brick.grid_position
+            self.brick_grid[grid_row][grid_col] = None
+            # Only a brick on the edge of the field can shrink the rect,
+            # and the recompute itself waits until the next collision pass.
+            if self.bricks_aabb is not None:
+                left, top, right, bottom = brick.get_bounds()
+                aabb = self.bricks_aabb
+                if (
+                    left <= aabb[0]
+                    or top <= aabb[1]
+                    or right >= aabb[2]
+                    or bottom >= aabb[3]
+                ):
+                    self._bricks_aabb_dirty = True
         self.combo += 1
         self.combo_timer = COMBO_TIMEOUT_FRAMES
         base_points = SCORE_BY_BRICK_TYPE[brick.brick_type]
@@ -1275,41 +1553,47 @@ class BreakoutGame:
         self.powerups.append(PowerUp(self.canvas, x, y, kind))
 
     def apply_powerup(self, powerup: PowerUp) -> None:
-        name = POWERUP_NAMES[powerup.kind]
         self.sound.play("powerup")
         self.start_screen_shake(6, 2.7)
 
-        if powerup.kind == BrickType.MULTI_BALL:
-            self.add_extra_ball()
-            self.add_extra_ball()
-        elif powerup.kind == BrickType.SPEED_UP:
-            for ball in self.balls:
-                ball.speed_up(1.14)
-        elif powerup.kind == BrickType.EXPAND_PADDLE:
-            self.paddle.expand()
-            self.paddle_boost_timer = PADDLE_BOOST_FRAMES
-        elif powerup.kind == BrickType.EXTRA_LIFE:
-            self.lives = min(9, self.lives + 1)
-        elif powerup.kind == BrickType.BONUS_SCORE:
-            bonus = 120 + self.combo * 10
-            self.score += bonus
-            self.high_score = max(self.high_score, self.score)
-            name = f"Bonus +{bonus}"
-
+        # Effects may return a label override (e.g. the bonus amount).
+        name = self._powerup_effects[powerup.kind]() or POWERUP_NAMES[powerup.kind]
         self.add_floating_text(powerup.x, self.paddle.y - 28, name, powerup.color)
 
+    def _catch_multi_ball(self) -> None:
+        self.add_extra_ball()
+        self.add_extra_ball()
+
+    def _catch_speed_up(self) -> None:
+        for ball in self.balls:
+            ball.speed_up(1.14)
+
+    def _catch_expand_paddle(self) -> None:
+        self.paddle.expand()
+        self.paddle_boost_timer = PADDLE_BOOST_FRAMES
+
+    def _catch_extra_life(self) -> None:
+        self.lives = min(9, self.lives + 1)
+
+    def _catch_bonus_score(self) -> str:
+        bonus = 120 + self.combo * 10
+        self.score += bonus
+        self.high_score = max(self.high_score, self.score)
+        return f"Bonus +{bonus}"
+
     def add_extra_ball(self) -> None:
         if not self.balls or len(self.balls) >= MAX_BALLS:
             return
-        base_ball = random.choice(self.balls)
-        angle = random.uniform(-0.95, 0.95)
-        new_ball = Ball(
-            self.canvas,
+        base_ball = _choice(self.balls)
+        new_ball = self._acquire_ball(
             base_ball.x + random.randint(-10, 10),
             base_ball.y - 8,
-            speed_multiplier=self.settings.speed_multiplier * self.wave_speed(),
         )
-        new_ball.launch(angle)
+        unit_dx, unit_dy = _choice(_EXTRA_BALL_DIRS)
+        speed = new_ball.base_speed
+        new_ball.dx = speed * unit_dx
+        new_ball.dy = speed * unit_dy
+        new_ball.stuck_to_paddle = False
         self.balls.append(new_ball)
 
     def update_powerups(self) -> None:
@@ -1328,11 +1612,14 @@ class BreakoutGame:
                 self.powerups.remove(powerup)
 
     def remove_out_of_bounds_balls(self) -> None:
-        for ball in self.balls[:]:
+        survivors = []
+        for ball in self.balls:
             if ball.get_bounds()[1] > CANVAS_HEIGHT + 10:
-                ball.destroy()
-                self.balls.remove(ball)
+                self._release_ball(ball)
                 self.sound.play("miss")
+            else:
+                survivors.append(ball)
+        self.balls = survivors
 
         if not self.balls:
             self.lose_life()
@@ -1350,7 +1637,7 @@ class BreakoutGame:
             self.paddle.reset_size()
             self.paddle_boost_timer = 0
             self.prepare_launch_ball()
-            self.pressed_keys.clear()
+            self.pressed_mask = 0
             self._show_overlay("Ball lost", "SPACE launch when ready")
             self._set_mode(MODE_READY)
             self.update_ui()
@@ -1358,7 +1645,7 @@ class BreakoutGame:
             self.game_over()
 
     def check_game_over(self) -> bool:
-        if not self.bricks:
+        if self.remaining_bricks == 0:
             self.win_game()
             return True
         if self.lives <= 0:
@@ -1368,7 +1655,7 @@ class BreakoutGame:
 
     def win_game(self) -> None:
         self._set_mode(MODE_LEVEL_CLEAR)
-        self.pressed_keys.clear()
+        self.pressed_mask = 0
         self.high_score = max(self.high_score, self.score)
         self.sound.play("level")
         self._show_overlay(
@@ -1378,7 +1665,7 @@ class BreakoutGame:
 
     def game_over(self) -> None:
         self._set_mode(MODE_GAME_OVER)
-        self.pressed_keys.clear()
+        self.pressed_mask = 0
         self.high_score = max(self.high_score, self.score)
         self.sound.play("game_over")
         self._show_overlay(
@@ -1470,13 +1757,21 @@ class BreakoutGame:
         )
 
     def update_ui(self) -> None:
-        self.canvas.itemconfig(self.score_text, text=f"Score {self.score}")
-        self.canvas.itemconfig(self.high_score_text, text=f"High {self.high_score}")
-        self.canvas.itemconfig(self.level_text, text=f"Wave {self.level}")
-        self.canvas.itemconfig(self.lives_text, text=f"Lives {self.lives}")
-        self.canvas.itemconfig(self.balls_text, text=f"Balls {len(self.balls)}")
+        # update_ui runs every frame but the values change rarely, so each
+        # itemconfig (a Python/Tcl round trip) is skipped while the drawn
+        # string is already current.
+        self._set_ui_text(self.score_text, f"Score {self.score}")
+        self._set_ui_text(self.high_score_text, f"High {self.high_score}")
+        self._set_ui_text(self.level_text, f"Wave {self.level}")
+        self._set_ui_text(self.lives_text, f"Lives {self.lives}")
+        self._set_ui_text(self.balls_text, f"Balls {len(self.balls)}")
         combo = f"Combo x{self.combo}" if self.combo >= 2 else ""
-        self.canvas.itemconfig(self.combo_text, text=combo)
+        self._set_ui_text(self.combo_text, combo)
+
+    def _set_ui_text(self, item_id: int, text: str) -> None:
+        if self._drawn_ui_text.get(item_id) != text:
+            self.canvas.itemconfig(item_id, text=text)
+            self._drawn_ui_text[item_id] = text
 
     def _show_overlay(self, title: str, subtitle: str) -> None:
         self._clear_overlay()
@@ -67,14 +67,16 @@ Output:
 
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import asdict, dataclass
+from functools import lru_cache
 import json
 import os
 import platform
+import time
 from typing import Any, Iterable
 
 import click
-import psutil
 from rich import box
 from rich.console import Console, Group, RenderableType
 from rich.panel import Panel
@@ -92,6 +94,7 @@ WARN = "#ffcc66"
 ERROR = "#ff6b6b"
 TEXT = "#dbffe9"
 MUTED = "#9ca9a3"
+DIM_MUTED = f"dim {MUTED}"
 PANEL = "#38d878"
 
 NOISY_FILESYSTEMS = {
@@ -132,6 +135,52 @@ MACOS_USEFUL_SYSTEM_MOUNTS = {
 
 console = Console()
 
+# Partition and usage snapshots are syscalls (statfs per mount), so repeat
+# lookups within one run reuse a short-lived cache. Errors are cached too,
+# so an unreadable mount is not re-stat'd inside the window.
+PSUTIL_CACHE_TTL = 2.0
+
+_psutil_cache: dict[tuple[str, Any], tuple[float, Any]] = {}
+
+
+def _cached_psutil_call(key: tuple[str, Any], call: Any) -> Any:
+    now = time.monotonic()
+    entry = _psutil_cache.get(key)
+    if entry is not None and now - entry[0] < PSUTIL_CACHE_TTL:
+        result = entry[1]
+        if isinstance(result, Exception):
+            raise result
+        return result
+
+    try:
+        result = call()
+    except OSError as error:
+        _psutil_cache[key] = (now, error)
+        raise
+    _psutil_cache[key] = (now, result)
+    return result
+
+
+def cached_disk_partitions(include_all: bool = False) -> list[Any]:
+    """Return psutil partitions, reusing a recent snapshot when fresh."""
+
+    # psutil is this script's slowest import and is only needed once data
+    # collection actually starts; --help and argument errors skip it.
+    import psutil
+
+    return _cached_psutil_call(
+        ("partitions", include_all),
+        lambda: psutil.disk_partitions(all=include_all),
+    )
+
+
+def cached_disk_usage(path: str) -> Any:
+    """Return psutil usage for a path, reusing a recent result when fresh."""
+
+    import psutil
+
+    return _cached_psutil_call(("usage", path), lambda: psutil.disk_usage(path))
+
 
 @dataclass(frozen=True)
 class DiskUsage:
@@ -160,6 +209,9 @@ class UsageStatus:
     detail: str
 
 
+BYTE_UNITS = ("B", "KB", "MB", "GB", "TB", "PB")
+
+
 def format_bytes(value: int | float | str) -> str:
     """Return a compact human-readable byte value."""
 
@@ -168,11 +220,12 @@ def format_bytes(value: int | float | str) -> str:
     except (TypeError, ValueError):
         amount = 0.0
 
-    for unit in ["B", "KB", "MB", "GB", "TB"]:
-        if amount < 1024.0:
-            return f"{amount:.1f} {unit}" if unit != "B" else f"{amount:.0f} {unit}"
-        amount /= 1024.0
-    return f"{amount:.1f} PB"
+    if amount < 1024.0:
+        return f"{amount:.0f} B"
+    # bit_length picks the unit in one step instead of dividing by 1024
+    # per unit; a shift then scales the value for display.
+    index = min(5, (int(amount).bit_length() - 1) // 10)
+    return f"{amount / (1 << (index * 10)):.1f} {BYTE_UNITS[index]}"
 
 
 def usage_status(
@@ -189,15 +242,22 @@ def usage_status(
     return UsageStatus("ok", ACCENT, "healthy")
 
 
+@lru_cache(maxsize=8)
+def bar_segments(width: int) -> tuple[tuple[str, str], ...]:
+    """Return the (filled, empty) glyph pair for every fill level of a width."""
+
+    return tuple(("█" * level, "░" * (width - level)) for level in range(width + 1))
+
+
 def usage_bar(percent: float, width: int = 8) -> Text:
     """Return a Rich progress bar for disk usage."""
 
     filled = min(width, max(0, int(width * percent / 100)))
-    empty = width - filled
+    filled_glyphs, empty_glyphs = bar_segments(width)[filled]
     status = usage_status(percent)
     text = Text()
-    text.append("█" * filled, style=status.color)
-    text.append("░" * empty, style=f"dim {MUTED}")
+    text.append(filled_glyphs, style=status.color)
+    text.append(empty_glyphs, style=DIM_MUTED)
     text.append(f" {percent:5.1f}%", style=status.color)
     return text
 
@@ -245,7 +305,7 @@ def disk_usage_from_partition(partition: Any) -> DiskUsage:
     """Read psutil usage data for one partition."""
 
     mountpoint = partition_attr(partition, "mountpoint")
-    usage = psutil.disk_usage(mountpoint)
+    usage = cached_disk_usage(mountpoint)
     return DiskUsage(
         mountpoint=mountpoint,
         device=partition_attr(partition, "device", "unknown"),
@@ -258,13 +318,23 @@ def disk_usage_from_partition(partition: Any) -> DiskUsage:
     )
 
 
+def _disk_usage_or_none(partition: Any) -> DiskUsage | None:
+    """Read usage for one partition, treating unreadable mounts as missing."""
+
+    try:
+        return disk_usage_from_partition(partition)
+    except (FileNotFoundError, OSError, PermissionError):
+        return None
+
+
 def collect_disk_usages(include_all: bool = False) -> tuple[list[DiskUsage], int]:
     """Collect readable usage data and return skipped/hidden mount count."""
 
     usages: list[DiskUsage] = []
     skipped_count = 0
     seen_mounts: set[str] = set()
-    partitions = psutil.disk_partitions(all=include_all)
+    candidates: list[Any] = []
+    partitions = cached_disk_partitions(include_all)
     has_macos_data_volume = any(
         partition_attr(partition, "mountpoint") == "/System/Volumes/Data"
         for partition in partitions
@@ -281,16 +351,21 @@ def collect_disk_usages(include_all: bool = False) -> tuple[list[DiskUsage], int
             skipped_count += 1
             continue
 
-        try:
-            usage = disk_usage_from_partition(partition)
-        except (FileNotFoundError, OSError, PermissionError):
-            skipped_count += 1
-            continue
+        candidates.append(partition)
+
+    # Each usage read is a blocking statfs that can stall on slow or
+    # network mounts; issuing them from a thread pool overlaps the waits
+    # while map() keeps the partition order.
+    if candidates:
+        with ThreadPoolExecutor(max_workers=min(32, len(candidates))) as executor:
+            results = list(executor.map(_disk_usage_or_none, candidates))
+    else:
+        results = []
 
-        if usage.total <= 0:
+    for usage in results:
+        if usage is None or usage.total <= 0:
             skipped_count += 1
             continue
-
         usages.append(usage)
 
     return usages, skipped_count
@@ -338,11 +413,11 @@ def inspect_path(path: str) -> DiskUsage:
     """Return disk usage for a path, including partition metadata when possible."""
 
     try:
-        usage = psutil.disk_usage(path)
+        usage = cached_disk_usage(path)
     except (FileNotFoundError, PermissionError, OSError) as error:
         raise click.ClickException(f"Cannot inspect {path}: {error}") from error
 
-    partition = find_partition_for_path(path, psutil.disk_partitions(all=True))
+    partition = find_partition_for_path(path, cached_disk_partitions(include_all=True))
     if partition is None:
         return DiskUsage(
             mountpoint=os.path.abspath(path),
@@ -393,11 +468,11 @@ def create_header(
     heading.append("\n")
     heading.append(f"{visible_count} visible", style=TEXT)
     heading.append("  ")
-    heading.append(f"{skipped_count} hidden/skipped", style=f"dim {MUTED}")
+    heading.append(f"{skipped_count} hidden/skipped", style=DIM_MUTED)
     heading.append("  ")
-    heading.append(mode, style=f"dim {MUTED}")
+    heading.append(mode, style=DIM_MUTED)
     heading.append("  ")
-    heading.append(f"sorted by {sort_by}", style=f"dim {MUTED}")
+    heading.append(f"sorted by {sort_by}", style=DIM_MUTED)
 
     return Panel.fit(
         heading,
@@ -415,11 +490,11 @@ def create_summary_panel(
     """Build a quick summary of the visible mounts."""
 
     table = Table.grid(padding=(0, 2))
-    table.add_column(style=f"dim {MUTED}", justify="right")
+    table.add_column(style=DIM_MUTED, justify="right")
     table.add_column(style=TEXT)
 
     if not usages:
-        table.add_row("status", f"[{WARN}]no readable mounts[/]")
+        table.add_row("status", Text("no readable mounts", style=WARN))
         table.add_row("hint", "try --all or inspect one path with -p")
     else:
         highest = max(usages, key=lambda usage: usage.percent)
@@ -429,13 +504,9 @@ def create_summary_panel(
             warn_threshold,
             critical_threshold,
         )
-        table.add_row(
-            "highest use",
-            (
-                f"[{highest_status.color}]{highest.percent:.1f}%[/] "
-                f"{highest.mountpoint}"
-            ),
-        )
+        highest_cell = Text(f"{highest.percent:.1f}%", style=highest_status.color)
+        highest_cell.append(f" {highest.mountpoint}", style=TEXT)
+        table.add_row("highest use", highest_cell)
         table.add_row("least free", f"{format_bytes(tightest.free)} {tightest.mountpoint}")
         table.add_row(
             "thresholds",
@@ -444,7 +515,7 @@ def create_summary_panel(
 
     return Panel(
         table,
-        title="[bold]summary[/bold]",
+        title=Text("summary", style="bold"),
         border_style=CYAN,
         box=box.SQUARE,
         padding=(1, 1),
@@ -477,20 +548,20 @@ def usage_row(
     row.append(status.label, style=status.color)
     row.append("\n")
     if detail:
-        row.append(detail, style=f"dim {MUTED}")
+        row.append(detail, style=DIM_MUTED)
         row.append("\n")
     row.append_text(usage_bar(usage.percent, width=18))
     row.append("\n")
-    row.append("total ", style=f"dim {MUTED}")
+    row.append("total ", style=DIM_MUTED)
     row.append(format_bytes(usage.total), style=TEXT)
     row.append("  ")
-    row.append("used ", style=f"dim {MUTED}")
+    row.append("used ", style=DIM_MUTED)
     row.append(
         format_bytes(usage.used),
         style=WARN if usage.percent >= warn_threshold else TEXT,
     )
     row.append("  ")
-    row.append("free ", style=f"dim {MUTED}")
+    row.append("free ", style=DIM_MUTED)
     row.append(format_bytes(usage.free), style=ACCENT)
     return row
 
@@ -505,7 +576,7 @@ def usage_rows(
     rows: list[RenderableType] = []
     for index, usage in enumerate(usages):
         if index:
-            rows.append(Text("─" * 40, style=f"dim {MUTED}"))
+            rows.append(Text("─" * 40, style=DIM_MUTED))
         rows.append(usage_row(usage, warn_threshold, critical_threshold))
     return Group(*rows)
 
@@ -522,10 +593,10 @@ def create_table_panel(
         empty = Text()
         empty.append("No readable disk usage rows.", style=f"bold {TEXT}")
         empty.append("\n")
-        empty.append("Try --all or inspect a specific path with -p.", style=f"dim {MUTED}")
+        empty.append("Try --all or inspect a specific path with -p.", style=DIM_MUTED)
         return Panel(
             empty,
-            title="[bold]mounts[/bold]",
+            title=Text("mounts", style="bold"),
             border_style=PANEL,
             box=box.SQUARE,
             padding=(1, 1),
@@ -534,8 +605,8 @@ def create_table_panel(
     subtitle = f"{hidden_by_limit} more hidden by --limit" if hidden_by_limit else None
     return Panel(
         usage_rows(usages, warn_threshold, critical_threshold),
-        title="[bold]mounts[/bold]",
-        subtitle=Text(subtitle, style=f"dim {MUTED}") if subtitle else None,
+        title=Text("mounts", style="bold"),
+        subtitle=Text(subtitle, style=DIM_MUTED) if subtitle else None,
         border_style=PANEL,
         box=box.SQUARE,
         padding=(0, 1),
@@ -580,7 +651,7 @@ def create_detail_panel(
 
     status = usage_status(usage.percent, warn_threshold, critical_threshold)
     info = Table.grid(padding=(0, 2))
-    info.add_column(style=f"dim {MUTED}", justify="right")
+    info.add_column(style=DIM_MUTED, justify="right")
     info.add_column(style=TEXT)
     info.add_row("path", os.path.abspath(path))
     info.add_row("mount", usage.mountpoint)
@@ -589,12 +660,14 @@ def create_detail_panel(
     info.add_row("total", format_bytes(usage.total))
     info.add_row("used", format_bytes(usage.used))
     info.add_row("free", format_bytes(usage.free))
-    info.add_row("status", f"[{status.color}]{status.label}[/]  {status.detail}")
+    status_cell = Text(status.label, style=status.color)
+    status_cell.append(f"  {status.detail}", style=TEXT)
+    info.add_row("status", status_cell)
     info.add_row("usage", usage_bar(usage.percent, width=24))
 
     return Panel(
         info,
-        title="[bold]disk detail[/bold]",
+        title=Text("disk detail", style="bold"),
         border_style=status.color,
         box=box.SQUARE,
         padding=(1, 1),
@@ -52,7 +52,8 @@ Output:
 """
 
 import argparse
-import base64
+import binascii
+import os
 import secrets
 import sys
 
@@ -69,12 +70,17 @@ def generate_secret(byte_count: int = 32, output_format: str = "hex") -> str:
         Encoded secret string.
     """
     if output_format == "hex":
-        return secrets.token_hex(byte_count)
+        # Same CSPRNG bytes token_hex would produce, but hexlify is a
+        # straight C call without the extra Python frame and str round
+        # trip — this call is the whole tool, so it may as well be direct.
+        return binascii.hexlify(os.urandom(byte_count)).decode("ascii")
     if output_format == "urlsafe":
         return secrets.token_urlsafe(byte_count)
     if output_format == "base64":
-        secret_bytes = secrets.token_bytes(byte_count)
-        return base64.urlsafe_b64encode(secret_bytes).decode("ascii").rstrip("=")
+        # token_urlsafe is exactly urlsafe_b64encode(token_bytes(n)) with
+        # the padding stripped, done in one call without the intermediate
+        # bytes object.
+        return secrets.token_urlsafe(byte_count)
 
     raise ValueError(f"Unsupported output format: {output_format}")
 
@@ -122,18 +128,22 @@ def main() -> None:
             print(secret)
             return
 
-        print("Generated Secret:")
-        print(secret)
-        print()
-        print("Usage in a Flask app:")
-        print(f"app.config['SECRET_KEY'] = '{secret}'")
-        print()
-        print("Or set as an environment variable:")
-        print(f"export {args.env_name}='{secret}'")
+        # One write instead of eight print calls, so piped consumers see a
+        # single atomic chunk.
+        sys.stdout.write(
+            "Generated Secret:\n"
+            f"{secret}\n"
+            "\n"
+            "Usage in a Flask app:\n"
+            f"app.config['SECRET_KEY'] = '{secret}'\n"
+            "\n"
+            "Or set as an environment variable:\n"
+            f"export {args.env_name}='{secret}'\n"
+        )
     except KeyboardInterrupt:
         print("\nOperation cancelled by user.")
         sys.exit(0)
-    except Exception as e:
+    except (OSError, ValueError) as e:
         print(f"Unexpected error: {e}")
         sys.exit(1)
 
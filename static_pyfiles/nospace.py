@@ -78,7 +78,6 @@ from rich.table import Table
 from rich.text import Text
 
 
-SPACE_PATTERN = re.compile(" ")
 WHITESPACE_PATTERN = re.compile(r"\s+")
 
 PANEL_STYLE = "#7cc7ff"
@@ -109,8 +108,14 @@ class NoSpaceResult:
 def clean_text(text: str, all_whitespace: bool = False) -> NoSpaceResult:
     """Remove spaces or all whitespace from text and return transformation data."""
 
-    pattern = WHITESPACE_PATTERN if all_whitespace else SPACE_PATTERN
-    cleaned = pattern.sub("", text)
+    if all_whitespace:
+        cleaned = WHITESPACE_PATTERN.sub("", text)
+    elif " " in text:
+        cleaned = text.replace(" ", "")
+    else:
+        # The containment check is a memchr scan, so already-clean input
+        # comes back without allocating a copy of itself.
+        cleaned = text
     return NoSpaceResult(
         original=text,
         cleaned=cleaned,
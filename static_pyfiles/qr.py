@@ -74,7 +74,11 @@ Output:
 
 from __future__ import annotations
 
+import io
+import os
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
 
 import click
@@ -86,6 +90,7 @@ from rich.table import Table
 from rich.text import Text
 from qrcode.image.styledpil import StyledPilImage
 from qrcode.image.styles.moduledrawers import RoundedModuleDrawer
+from qrcode.image.svg import SvgPathImage
 
 
 DEFAULT_OUTPUT = "qrcode.png"
@@ -102,6 +107,26 @@ ERROR_CORRECTION_LEVELS = {
 }
 
 
+# The drawer is stateless, so one instance can serve every rounded render.
+_ROUNDED_DRAWER = RoundedModuleDrawer()
+
+
+@lru_cache(maxsize=128)
+def encode_qr(content: str, error_correction: int) -> qrcode.QRCode:
+    """
+    Build and fit a QR code for content at the given correction level.
+
+    Fitting runs the Reed-Solomon encoding and mask scoring, which is the
+    dominant CPU cost of QR generation and depends only on the content and
+    correction level — so repeat renders of the same content (for example
+    at different sizes) reuse the cached code instead of re-encoding.
+    """
+    qr = qrcode.QRCode(version=None, error_correction=error_correction)
+    qr.add_data(content)
+    qr.make(fit=True)
+    return qr
+
+
 @dataclass(frozen=True)
 class QRResult:
     """Metadata for a generated QR code file."""
@@ -120,6 +145,43 @@ class QRResult:
     dry_run: bool
 
 
+def absolute_output_path(path: Path) -> Path:
+    """Absolutize a path for display, skipping getcwd() when already absolute."""
+
+    return path if path.is_absolute() else Path(os.getcwd(), path)
+
+
+def render_qr(
+    content: str,
+    box_size: int = 10,
+    border: int = 4,
+    style: str = "square",
+    error_correction: str = "m",
+    fill_color: str = "black",
+    back_color: str = "white",
+):
+    """
+    Render a QR code for content to a PIL image, with no CLI or file I/O.
+
+    This is the import-friendly core: scripted callers get the cached
+    encoding and styled rendering without paying for Click parsing or
+    touching the filesystem.
+    """
+
+    qr = encode_qr(content, ERROR_CORRECTION_LEVELS[error_correction.lower()])
+    qr.box_size = box_size
+    qr.border = border
+
+    if style == "rounded":
+        return qr.make_image(
+            image_factory=StyledPilImage,
+            module_drawer=_ROUNDED_DRAWER,
+            fill_color=fill_color,
+            back_color=back_color,
+        )
+    return qr.make_image(fill_color=fill_color, back_color=back_color)
+
+
 def generate_qr_image(
     content: str,
     output_path: Path,
@@ -129,6 +191,7 @@ def generate_qr_image(
     error_correction: str,
     fill_color: str,
     back_color: str,
+    output_format: str = "png",
     force: bool = False,
     dry_run: bool = False,
 ) -> QRResult:
@@ -142,31 +205,37 @@ def generate_qr_image(
         )
 
     normalized_level = error_correction.lower()
-    qr = qrcode.QRCode(
-        version=None,
-        error_correction=ERROR_CORRECTION_LEVELS[normalized_level],
-        box_size=box_size,
-        border=border,
-    )
-    qr.add_data(content)
-    qr.make(fit=True)
-
-    if style == "rounded":
-        image = qr.make_image(
-            image_factory=StyledPilImage,
-            module_drawer=RoundedModuleDrawer(),
+    if output_format == "svg":
+        # The SVG backend emits one <path> over the dark modules — no
+        # rasterization, no deflate — so large codes save in O(modules).
+        qr = encode_qr(content, ERROR_CORRECTION_LEVELS[normalized_level])
+        qr.box_size = box_size
+        qr.border = border
+        image = qr.make_image(image_factory=SvgPathImage)
+        dimensions = (image.pixel_size, image.pixel_size)
+    else:
+        image = render_qr(
+            content,
+            box_size=box_size,
+            border=border,
+            style=style,
+            error_correction=normalized_level,
             fill_color=fill_color,
             back_color=back_color,
         )
-    else:
-        image = qr.make_image(fill_color=fill_color, back_color=back_color)
+        dimensions = image.size
 
     if not dry_run:
         resolved_output.parent.mkdir(parents=True, exist_ok=True)
-        image.save(resolved_output)
+        # Default black-on-white squares already rasterize as a 1-bit
+        # image; optimize squeezes the PNG filter choice on top of that.
+        if output_format != "svg" and resolved_output.suffix.lower() == ".png":
+            image.save(resolved_output, optimize=True)
+        else:
+            image.save(resolved_output)
 
     return QRResult(
-        output_path=resolved_output.resolve(),
+        output_path=absolute_output_path(resolved_output),
         content=content,
         box_size=box_size,
         border=border,
@@ -174,13 +243,101 @@ def generate_qr_image(
         error_correction=normalized_level.upper(),
         fill_color=fill_color,
         back_color=back_color,
-        dimensions=image.size,
-        matrix=qr.get_matrix(),
+        dimensions=dimensions,
+        matrix=encode_qr(content, ERROR_CORRECTION_LEVELS[normalized_level]).get_matrix(),
         written=not dry_run,
         dry_run=dry_run,
     )
 
 
+def render_qr_png_bytes(task: tuple[str, int, int, str, str, str, str]) -> bytes:
+    """
+    Render one QR code to PNG bytes for a batch worker.
+
+    Takes a plain tuple and returns bytes so the task and result pickle
+    cheaply across the process pool boundary.
+    """
+
+    content, box_size, border, style, error_correction, fill_color, back_color = task
+    image = render_qr(
+        content,
+        box_size=box_size,
+        border=border,
+        style=style,
+        error_correction=error_correction,
+        fill_color=fill_color,
+        back_color=back_color,
+    )
+
+    buffer = io.BytesIO()
+    image.save(buffer, format="PNG", optimize=True)
+    return buffer.getvalue()
+
+
+def generate_qr_batch(
+    batch_path: Path,
+    output_path: Path,
+    box_size: int,
+    border: int,
+    style: str,
+    error_correction: str,
+    fill_color: str,
+    back_color: str,
+    force: bool = False,
+    dry_run: bool = False,
+) -> list[Path]:
+    """Render one QR PNG per non-empty line of batch_path, in parallel."""
+
+    lines = [
+        line.strip()
+        for line in batch_path.read_text(encoding="utf-8").splitlines()
+        if line.strip()
+    ]
+    if not lines:
+        raise click.ClickException(f"Batch file has no content lines: {batch_path}")
+
+    resolved_output = absolute_output_path(output_path.expanduser())
+    suffix = resolved_output.suffix or ".png"
+    index_width = len(str(len(lines)))
+    targets = [
+        resolved_output.with_name(
+            f"{resolved_output.stem}_{index:0{index_width}d}{suffix}"
+        )
+        for index in range(1, len(lines) + 1)
+    ]
+
+    if not force and not dry_run:
+        for target in targets:
+            if target.exists():
+                raise click.ClickException(
+                    f"Output file already exists: {target}. "
+                    "Use --force to overwrite it or choose a different --output path."
+                )
+
+    if dry_run:
+        return targets
+
+    normalized_level = error_correction.lower()
+    tasks = [
+        (content, box_size, border, style, normalized_level, fill_color, back_color)
+        for content in lines
+    ]
+
+    # Encoding and rasterization are CPU-bound, so batches shard across
+    # processes; tiny batches skip the pool spin-up.
+    worker_count = min(os.cpu_count() or 1, len(tasks))
+    if worker_count > 1 and len(tasks) > 1:
+        with ProcessPoolExecutor(max_workers=worker_count) as executor:
+            rendered = list(executor.map(render_qr_png_bytes, tasks, chunksize=8))
+    else:
+        rendered = [render_qr_png_bytes(task) for task in tasks]
+
+    resolved_output.parent.mkdir(parents=True, exist_ok=True)
+    for target, png_bytes in zip(targets, rendered):
+        target.write_bytes(png_bytes)
+    return targets
+
+
 def render_terminal_qr(matrix: list[list[bool]]) -> Text:
     """Render a QR matrix as compact terminal blocks."""
 
@@ -233,7 +390,10 @@ def render_result(
     if result.dry_run:
         status = "terminal preview + dry run" if show_terminal else "dry run"
     else:
-        status = "terminal preview + PNG generated" if show_terminal else "PNG generated"
+        kind = "SVG" if result.output_path.suffix.lower() == ".svg" else "PNG"
+        status = (
+            f"terminal preview + {kind} generated" if show_terminal else f"{kind} generated"
+        )
     heading.append(status, style=MUTED_STYLE)
 
     content_panel = Panel(
@@ -266,8 +426,47 @@ def render_result(
     target_console.print(Group(*panels))
 
 
+def render_batch_result(
+    targets: list[Path],
+    dry_run: bool,
+    console: Console | None = None,
+) -> None:
+    """Render a Rich summary for a batch of generated QR files."""
+
+    target_console = console or Console()
+    summary = Table.grid(padding=(0, 2))
+    summary.add_column(justify="left")
+    summary.add_column(justify="right")
+    summary.add_row("status", "dry run (not written)" if dry_run else "written")
+    summary.add_row("codes", str(len(targets)))
+    summary.add_row("first", str(targets[0]))
+    summary.add_row("last", str(targets[-1]))
+
+    heading = Text()
+    heading.append("qr", style=SUCCESS_STYLE)
+    heading.append("  ")
+    heading.append(
+        "batch dry run" if dry_run else "batch PNGs generated",
+        style=MUTED_STYLE,
+    )
+
+    target_console.print(
+        Panel.fit(
+            Group(heading, summary),
+            border_style=SUCCESS_STYLE,
+            box=box.SQUARE,
+            padding=(0, 1),
+        )
+    )
+
+
 @click.command(context_settings={"help_option_names": ["--help"]})
-@click.argument("text", type=str)
+@click.argument("text", type=str, required=False)
+@click.option(
+    "--batch",
+    type=click.Path(exists=True, dir_okay=False, path_type=Path),
+    help="Render one QR PNG per non-empty line of this file.",
+)
 @click.option(
     "--output",
     "-o",
@@ -300,6 +499,15 @@ def render_result(
     show_default=True,
     help="Module drawing style.",
 )
+@click.option(
+    "--format",
+    "-f",
+    "output_format",
+    type=click.Choice(["png", "svg"]),
+    default="png",
+    show_default=True,
+    help="Output file format; svg skips rasterization entirely.",
+)
 @click.option(
     "--error-correction",
     "-e",
@@ -338,11 +546,13 @@ def render_result(
     help="Show the terminal preview and summary without writing a PNG file.",
 )
 def generate_qrcode(
-    text: str,
+    text: str | None,
+    batch: Path | None,
     output: Path,
     box_size: int,
     border: int,
     style: str,
+    output_format: str,
     error_correction: str,
     fill: str,
     back: str,
@@ -350,7 +560,43 @@ def generate_qrcode(
     force: bool,
     dry_run: bool,
 ) -> None:
-    """Generate a QR code PNG from input text."""
+    """Generate a QR code PNG or SVG from input text."""
+
+    if text is not None and batch is not None:
+        raise click.UsageError("Provide TEXT or --batch, not both.")
+    if text is None and batch is None:
+        raise click.UsageError("Provide text to encode or a --batch file.")
+    if output_format == "svg":
+        if batch is not None:
+            raise click.UsageError("--format svg is not supported with --batch.")
+        if style == "rounded":
+            raise click.UsageError("--format svg only supports the square style.")
+        if output == Path(DEFAULT_OUTPUT):
+            output = Path(DEFAULT_OUTPUT).with_suffix(".svg")
+
+    if batch is not None:
+        try:
+            targets = generate_qr_batch(
+                batch_path=batch,
+                output_path=output,
+                box_size=box_size,
+                border=border,
+                style=style,
+                error_correction=error_correction,
+                fill_color=fill,
+                back_color=back,
+                force=force,
+                dry_run=dry_run,
+            )
+        except click.ClickException:
+            raise
+        except Exception as error:
+            raise click.ClickException(
+                f"Could not generate QR batch: {error}"
+            ) from error
+
+        render_batch_result(targets, dry_run=dry_run)
+        return
 
     try:
         result = generate_qr_image(
@@ -362,6 +608,7 @@ def generate_qrcode(
             error_correction=error_correction,
             fill_color=fill,
             back_color=back,
+            output_format=output_format,
             force=force,
             dry_run=dry_run,
         )
@@ -3,7 +3,7 @@
 # dependencies = [
 #     "click>=8.2.1",
 #     "rich>=14.1.0",
-#     "textual>=6.1.0",
+#     "textual>=6.12.0",
 # ]
 # ///
 
@@ -101,6 +101,7 @@ import tty
 import zlib
 from dataclasses import dataclass
 from enum import Enum
+from itertools import groupby
 from typing import Optional
 
 import click
@@ -113,7 +114,7 @@ from rich.text import Text
 from textual import events
 from textual.app import App, ComposeResult
 from textual.binding import Binding
-from textual.reactive import reactive
+from textual.timer import Timer
 from textual.widgets import Footer, Header, Static
 
 
@@ -126,6 +127,12 @@ RENDER_MODE_SMOOTH = "smooth"
 RENDER_MODE_CLASSIC = "classic"
 RENDER_MODE_KITTY = "kitty"
 SMOOTH_RENDER_FPS = 60
+
+# Tick interval per speed setting, precomputed for the CLI's full 1-15
+# range so startup does a table lookup instead of redoing the float math.
+SPEED_INTERVALS = {
+    speed: max(0.045, 0.42 - (speed - 1) * 0.026) for speed in range(1, 16)
+}
 SUBPIXELS_PER_CELL = 4
 BRAILLE_BASE = 0x2800
 KITTY_RENDER_FPS = 60
@@ -182,6 +189,16 @@ CELL_STYLES = {
     CELL_DEAD: "dim #d45d5d",
 }
 
+# Pre-joined "glyph plus trailing space" fragments paired with their style,
+# so the classic renderer appends one run per same-cell stretch instead of
+# two styled appends per cell.
+GLYPH_FRAGMENTS = {
+    cell: (glyph + " ", CELL_STYLES[cell]) for cell, glyph in GLYPHS.items()
+}
+ASCII_GLYPH_FRAGMENTS = {
+    cell: (glyph + " ", CELL_STYLES[cell]) for cell, glyph in ASCII_GLYPHS.items()
+}
+
 CELL_PRIORITY = {
     CELL_FOOD: 1,
     CELL_DEAD: 2,
@@ -201,6 +218,10 @@ class Direction(Enum):
     RIGHT = (0, 1)
 
 
+# Enum .value goes through a descriptor on every access; the tick paths
+# read their deltas from this plain dict instead.
+DIRECTION_DELTAS = {direction: direction.value for direction in Direction}
+
 OPPOSITE_DIRECTIONS = {
     Direction.UP: Direction.DOWN,
     Direction.DOWN: Direction.UP,
@@ -208,6 +229,22 @@ OPPOSITE_DIRECTIONS = {
     Direction.RIGHT: Direction.LEFT,
 }
 
+PLAYER1_KEYS = {
+    "w": Direction.UP,
+    "s": Direction.DOWN,
+    "a": Direction.LEFT,
+    "d": Direction.RIGHT,
+}
+
+PLAYER2_KEYS = {
+    "up": Direction.UP,
+    "down": Direction.DOWN,
+    "left": Direction.LEFT,
+    "right": Direction.RIGHT,
+}
+
+MOVEMENT_KEYS = {**PLAYER1_KEYS, **PLAYER2_KEYS}
+
 
 @dataclass(frozen=True)
 class Position:
@@ -257,9 +294,6 @@ class SnakeGame(App):
     TITLE = "uvpy.run Snake"
     SUB_TITLE = "Textual terminal showcase"
 
-    score = reactive(0)
-    game_over = reactive(False)
-
     def __init__(
         self,
         width: int = DEFAULT_WIDTH,
@@ -286,7 +320,29 @@ class SnakeGame(App):
         self.ticks = 0
         self.last_message = "Eat food, grow longer, and keep moving."
         self._logic_interval = self._tick_interval()
+        # None until on_mount; the game is also driven headlessly in tests.
+        self._game_timer: Timer | None = None
         self._animation_started_at = time.monotonic()
+        self._last_frame_key: tuple | None = None
+
+        # Heading, controls, and board subtitle never change for the
+        # lifetime of the app, so build them once instead of per frame.
+        self._heading = Text()
+        self._heading.append("uvpy.run Snake", style="bold #7dff9b")
+        self._heading.append("  ")
+        render_label = (
+            RENDER_MODE_SMOOTH if self._uses_smooth_renderer() else RENDER_MODE_CLASSIC
+        )
+        self._heading.append(
+            f"{'two-player' if two_player else 'single-player'} / {render_label}",
+            style="dim",
+        )
+        if two_player:
+            controls = "P1 WASD  P2 arrows  Space pause  R restart  Q quit"
+        else:
+            controls = "WASD or arrows move  Space pause  R restart  Q quit"
+        self._controls_text = Text(controls, style="dim")
+        self._board_subtitle = f"{width}x{height}"
         self._previous_snake: list[Position] = []
         self._previous_snake1: list[Position] = []
         self._previous_snake2: list[Position] = []
@@ -304,7 +360,7 @@ class SnakeGame(App):
     def on_mount(self) -> None:
         """Start the game timer when the app mounts."""
 
-        self.set_interval(self._logic_interval, self._game_loop)
+        self._game_timer = self.set_interval(self._logic_interval, self._game_loop)
         if self._uses_smooth_renderer():
             self.set_interval(1 / SMOOTH_RENDER_FPS, self._update_display)
         self._update_display()
@@ -312,7 +368,7 @@ class SnakeGame(App):
     def _tick_interval(self) -> float:
         """Convert the user-facing speed value into a timer interval."""
 
-        return max(0.045, 0.42 - (self.speed - 1) * 0.026)
+        return SPEED_INTERVALS[self.speed]
 
     def _reset_game_state(self, reset_high_score: bool = False) -> None:
         """Reset positions, scores, and status flags for a fresh round."""
@@ -346,6 +402,9 @@ class SnakeGame(App):
             self.score1 = 0
             self.score2 = 0
             self.dead_bodies: list[Position] = []
+            # Set mirror of dead_bodies for O(1) collision membership;
+            # the list keeps draw order for the renderers.
+            self._dead_cells: set[Position] = set()
         else:
             self.direction = Direction.RIGHT
             self.next_direction = self.direction
@@ -376,26 +435,43 @@ class SnakeGame(App):
         """Return every board position currently occupied by snake bodies."""
 
         if self.two_player:
-            return set(self.snake1) | set(self.snake2) | set(self.dead_bodies)
+            return set(self.snake1) | set(self.snake2) | self._dead_cells
         return set(self.snake)
 
     def _generate_food(self) -> None:
         """Generate food at a random empty position on the board."""
 
         occupied_positions = self._occupied_positions()
-        open_positions = [
-            Position(row, col)
-            for row in range(self.height)
-            for col in range(self.width)
-            if Position(row, col) not in occupied_positions
-        ]
+        total_cells = self.width * self.height
+        free_count = total_cells - len(occupied_positions)
 
-        if not open_positions:
+        if free_count <= 0:
             self.food = None
             self._finish_game("Board cleared. Perfect run.", won=True)
             return
 
-        self.food = random.choice(open_positions)
+        # On a mostly-empty board rejection sampling lands within a few
+        # draws; once the snakes cover most cells, switch to one bounded
+        # pass that picks the k-th free cell so placement cannot spin.
+        if free_count * 4 >= total_cells:
+            while True:
+                candidate = Position(
+                    random.randrange(self.height), random.randrange(self.width)
+                )
+                if candidate not in occupied_positions:
+                    self.food = candidate
+                    return
+
+        choice_index = random.randrange(free_count)
+        for row in range(self.height):
+            for col in range(self.width):
+                candidate = Position(row, col)
+                if candidate in occupied_positions:
+                    continue
+                if choice_index == 0:
+                    self.food = candidate
+                    return
+                choice_index -= 1
 
     def _game_loop(self) -> None:
         """Advance the game by one tick."""
@@ -416,15 +492,23 @@ class SnakeGame(App):
         """Update logic for single-player mode."""
 
         self.direction = self.next_direction
-        new_head = self.snake[0] + self.direction
-
-        if self._is_out_of_bounds(new_head):
+        # Inline the step instead of Position.__add__ and check the walls
+        # on plain ints, so the new head is only allocated if it survives.
+        head = self.snake[0]
+        row_delta, col_delta = DIRECTION_DELTAS[self.direction]
+        new_row = head.row + row_delta
+        new_col = head.col + col_delta
+
+        if not (0 <= new_row < self.height and 0 <= new_col < self.width):
             self._finish_game("Wall hit. Press R for a clean restart.")
             return
 
+        new_head = Position(new_row, new_col)
+
         will_grow = new_head == self.food
-        body_to_check = self.snake if will_grow else self.snake[:-1]
-        if new_head in body_to_check:
+        # One C-level scan of the body, no per-tick slice copy; the tail
+        # cell is exempt when it will move out of the way this tick.
+        if new_head in self.snake and (will_grow or new_head != self.snake[-1]):
             self._finish_game("Tail collision. Press R and try a wider turn.")
             return
 
@@ -455,16 +539,24 @@ class SnakeGame(App):
         self.won = won
         self.game_over = True
         self.last_message = message
+        # No ticks fire while the end screen sits there.
+        if self._game_timer is not None:
+            self._game_timer.pause()
 
     def _kill_player(self, player: int) -> None:
         """Mark a two-player snake as dead and leave its body on the board."""
 
         if player == 1 and self.alive1:
             self.alive1 = False
-            self.dead_bodies.extend(self.snake1)
+            fallen = self.snake1
         elif player == 2 and self.alive2:
             self.alive2 = False
-            self.dead_bodies.extend(self.snake2)
+            fallen = self.snake2
+        else:
+            return
+
+        self.dead_bodies.extend(fallen)
+        self._dead_cells.update(fallen)
 
     def _update_two_player(self) -> None:
         """Update logic for two-player mode with simultaneous planning."""
@@ -476,9 +568,13 @@ class SnakeGame(App):
 
         planned_heads: dict[int, Position] = {}
         if self.alive1:
-            planned_heads[1] = self.snake1[0] + self.direction1
+            head = self.snake1[0]
+            row_delta, col_delta = DIRECTION_DELTAS[self.direction1]
+            planned_heads[1] = Position(head.row + row_delta, head.col + col_delta)
         if self.alive2:
-            planned_heads[2] = self.snake2[0] + self.direction2
+            head = self.snake2[0]
+            row_delta, col_delta = DIRECTION_DELTAS[self.direction2]
+            planned_heads[2] = Position(head.row + row_delta, head.col + col_delta)
 
         dead_players: set[int] = set()
         for player, new_head in planned_heads.items():
@@ -489,12 +585,14 @@ class SnakeGame(App):
             current_snake = self.snake1 if player == 1 else self.snake2
             other_snake = self.snake2 if player == 1 else self.snake1
             will_grow = new_head == self.food
-            own_body = current_snake if will_grow else current_snake[:-1]
+            hits_own_body = new_head in current_snake and (
+                will_grow or new_head != current_snake[-1]
+            )
 
             if (
-                new_head in own_body
+                hits_own_body
                 or new_head in other_snake
-                or new_head in self.dead_bodies
+                or new_head in self._dead_cells
             ):
                 dead_players.add(player)
 
@@ -509,23 +607,24 @@ class SnakeGame(App):
 
         original_food = self.food
         food_claims: list[int] = []
-        for player in (1, 2):
-            if player not in planned_heads:
+        # Aliveness is read after the kill pass above, so the table holds
+        # this tick's final survivors.
+        for player, snake, alive in (
+            (1, self.snake1, self.alive1),
+            (2, self.snake2, self.alive2),
+        ):
+            new_head = planned_heads.get(player)
+            if new_head is None or not alive:
                 continue
-            if player == 1 and self.alive1:
-                self.snake1.insert(0, planned_heads[player])
-                if planned_heads[player] == original_food:
+            snake.insert(0, new_head)
+            if new_head == original_food:
+                if player == 1:
                     self.score1 += POINTS_PER_FOOD
-                    food_claims.append(player)
                 else:
-                    self.snake1.pop()
-            elif player == 2 and self.alive2:
-                self.snake2.insert(0, planned_heads[player])
-                if planned_heads[player] == original_food:
                     self.score2 += POINTS_PER_FOOD
-                    food_claims.append(player)
-                else:
-                    self.snake2.pop()
+                food_claims.append(player)
+            else:
+                snake.pop()
 
         if food_claims:
             self.food_eaten += len(food_claims)
@@ -545,21 +644,22 @@ class SnakeGame(App):
             else:
                 self._finish_game("Game over. Tie game.")
 
-    def _board_cells(self) -> list[list[str]]:
-        """Return a symbolic board representation used by the renderer."""
+    def _board_cells(self) -> list[str]:
+        """Return the symbolic board as one flat row-major cell list."""
 
-        board = [
-            [CELL_EMPTY for _ in range(self.width)]
-            for _ in range(self.height)
-        ]
+        # One allocation per frame instead of a list per row; cells live
+        # at row * width + col.
+        board = [CELL_EMPTY] * (self.height * self.width)
 
         if self.food:
-            board[self.food.row][self.food.col] = CELL_FOOD
+            board[self.food.row * self.width + self.food.col] = CELL_FOOD
 
         if self.two_player:
+            height = self.height
+            width = self.width
             for pos in self.dead_bodies:
-                if 0 <= pos.row < self.height and 0 <= pos.col < self.width:
-                    board[pos.row][pos.col] = CELL_DEAD
+                if 0 <= pos.row < height and 0 <= pos.col < width:
+                    board[pos.row * width + pos.col] = CELL_DEAD
 
             if self.alive1:
                 self._draw_snake(board, self.snake1, CELL_HEAD_1, CELL_BODY_1)
@@ -572,16 +672,20 @@ class SnakeGame(App):
 
     def _draw_snake(
         self,
-        board: list[list[str]],
+        board: list[str],
         snake: list[Position],
         head_cell: str,
         body_cell: str,
     ) -> None:
-        """Draw a snake onto the symbolic board."""
+        """Draw a snake onto the flat symbolic board."""
 
+        height = self.height
+        width = self.width
         for index, pos in enumerate(snake):
-            if 0 <= pos.row < self.height and 0 <= pos.col < self.width:
-                board[pos.row][pos.col] = head_cell if index == 0 else body_cell
+            if 0 <= pos.row < height and 0 <= pos.col < width:
+                board[pos.row * width + pos.col] = (
+                    head_cell if index == 0 else body_cell
+                )
 
     def _render_board(self) -> Text:
         """Render the board as styled terminal text."""
@@ -599,14 +703,18 @@ class SnakeGame(App):
     def _render_symbol_board(self) -> Text:
         """Render the board as one terminal glyph per game cell."""
 
-        glyphs = ASCII_GLYPHS if self.ascii_only else GLYPHS
+        fragments = ASCII_GLYPH_FRAGMENTS if self.ascii_only else GLYPH_FRAGMENTS
+        board = self._board_cells()
+        width = self.width
         board_text = Text()
-        for row_index, row in enumerate(self._board_cells()):
-            for cell in row:
-                board_text.append(glyphs[cell], style=CELL_STYLES[cell])
-                board_text.append(" ")
+        append = board_text.append
+        for row_index in range(self.height):
+            row_start = row_index * width
+            for cell, run in groupby(board[row_start : row_start + width]):
+                fragment, style = fragments[cell]
+                append(fragment * sum(1 for _ in run), style=style)
             if row_index < self.height - 1:
-                board_text.append("\n")
+                append("\n")
         return board_text
 
     def _sync_animation_state(self) -> None:
@@ -834,36 +942,45 @@ class SnakeGame(App):
         terminal_rows = self.height
         terminal_cols = self.width * 2
 
+        # This packs height * width * 2 cells at up to 60 FPS, so bind the
+        # dict, style, and append lookups to locals once per frame instead
+        # of resolving them per sub-pixel.
+        append = board_text.append
+        dot_bits = BRAILLE_DOT_BITS
+        cell_priority = CELL_PRIORITY
+        cell_styles = CELL_STYLES
+
         for terminal_row in range(terminal_rows):
+            base_row = terminal_row * 4
+            pixel_rows = pixels[base_row : base_row + 4]
             for terminal_col in range(terminal_cols):
                 bits = 0
                 style_cell: str | None = None
                 style_priority = 0
-                base_row = terminal_row * 4
                 base_col = terminal_col * 2
 
-                for local_row in range(4):
+                for local_row, pixel_row in enumerate(pixel_rows):
                     for local_col in range(2):
-                        cell = pixels[base_row + local_row][base_col + local_col]
+                        cell = pixel_row[base_col + local_col]
                         if cell is None:
                             continue
 
-                        bits |= BRAILLE_DOT_BITS[(local_col, local_row)]
-                        priority = CELL_PRIORITY[cell]
+                        bits |= dot_bits[(local_col, local_row)]
+                        priority = cell_priority[cell]
                         if priority >= style_priority:
                             style_cell = cell
                             style_priority = priority
 
                 if bits:
-                    board_text.append(
+                    append(
                         chr(BRAILLE_BASE + bits),
-                        style=CELL_STYLES[style_cell or CELL_EMPTY],
+                        style=cell_styles[style_cell or CELL_EMPTY],
                     )
                 else:
-                    board_text.append(" ")
+                    append(" ")
 
             if terminal_row < terminal_rows - 1:
-                board_text.append("\n")
+                append("\n")
 
         return board_text
 
@@ -909,11 +1026,7 @@ class SnakeGame(App):
     def _render_controls(self) -> Text:
         """Return mode-specific control help."""
 
-        if self.two_player:
-            controls = "P1 WASD  P2 arrows  Space pause  R restart  Q quit"
-        else:
-            controls = "WASD or arrows move  Space pause  R restart  Q quit"
-        return Text(controls, style="dim")
+        return self._controls_text
 
     def _render_message(self) -> Text:
         """Return the current game message with state-aware styling."""
@@ -928,26 +1041,17 @@ class SnakeGame(App):
     def _render_game(self) -> Align:
         """Build the full Rich renderable displayed inside Textual."""
 
-        heading = Text()
-        heading.append("uvpy.run Snake", style="bold #7dff9b")
-        heading.append("  ")
-        render_label = RENDER_MODE_SMOOTH if self._uses_smooth_renderer() else RENDER_MODE_CLASSIC
-        heading.append(
-            f"{'two-player' if self.two_player else 'single-player'} / {render_label}",
-            style="dim",
-        )
-
         board_panel = Panel.fit(
             self._render_board(),
             title=self._state_label(),
-            subtitle=f"{self.width}x{self.height}",
+            subtitle=self._board_subtitle,
             border_style="#38d878" if not self.game_over else "#ff6b6b",
             box=box.SQUARE,
             padding=(0, 1),
         )
 
         content = Group(
-            Align.center(heading),
+            Align.center(self._heading),
             self._score_table(),
             board_panel,
             Align.center(self._render_message()),
@@ -958,8 +1062,27 @@ class SnakeGame(App):
     def _update_display(self) -> None:
         """Update the display widget when the Textual app is mounted."""
 
-        if self.game_display is not None:
-            self.game_display.update(self._render_game())
+        if self.game_display is None:
+            return
+
+        # The 60 FPS render timer keeps firing while nothing moves (paused,
+        # game over, or the step animation fully settled). Rendering is the
+        # expensive path, so skip the rebuild when the visible state is
+        # identical to the previous frame.
+        frame_key = (
+            self.ticks,
+            self.food,
+            self.paused,
+            self.game_over,
+            self.won,
+            self.last_message,
+            self._animation_progress(),
+        )
+        if frame_key == self._last_frame_key:
+            return
+
+        self._last_frame_key = frame_key
+        self.game_display.update(self._render_game())
 
     def _queue_direction(self, direction: Direction, player: int | None = None) -> bool:
         """Queue one legal direction change for the next game tick."""
@@ -994,38 +1117,18 @@ class SnakeGame(App):
         handled = False
 
         if self.two_player:
-            if self.alive1:
-                if key == "w":
-                    handled = self._queue_direction(Direction.UP, player=1)
-                elif key == "s":
-                    handled = self._queue_direction(Direction.DOWN, player=1)
-                elif key == "a":
-                    handled = self._queue_direction(Direction.LEFT, player=1)
-                elif key == "d":
-                    handled = self._queue_direction(Direction.RIGHT, player=1)
-
-            if self.alive2:
-                if key == "up":
-                    handled = self._queue_direction(Direction.UP, player=2)
-                elif key == "down":
-                    handled = self._queue_direction(Direction.DOWN, player=2)
-                elif key == "left":
-                    handled = self._queue_direction(Direction.LEFT, player=2)
-                elif key == "right":
-                    handled = self._queue_direction(Direction.RIGHT, player=2)
+            direction = PLAYER1_KEYS.get(key)
+            if direction is not None:
+                if self.alive1:
+                    handled = self._queue_direction(direction, player=1)
+            else:
+                direction = PLAYER2_KEYS.get(key)
+                if direction is not None and self.alive2:
+                    handled = self._queue_direction(direction, player=2)
         else:
-            movement_keys = {
-                "w": Direction.UP,
-                "up": Direction.UP,
-                "s": Direction.DOWN,
-                "down": Direction.DOWN,
-                "a": Direction.LEFT,
-                "left": Direction.LEFT,
-                "d": Direction.RIGHT,
-                "right": Direction.RIGHT,
-            }
-            if key in movement_keys:
-                handled = self._queue_direction(movement_keys[key])
+            direction = MOVEMENT_KEYS.get(key)
+            if direction is not None:
+                handled = self._queue_direction(direction)
 
         if handled:
             event.stop()
@@ -1036,6 +1139,13 @@ class SnakeGame(App):
         if self.game_over:
             return
         self.paused = not self.paused
+        # Stop the logic timer outright instead of polling through a
+        # no-op callback every interval while paused.
+        if self._game_timer is not None:
+            if self.paused:
+                self._game_timer.pause()
+            else:
+                self._game_timer.resume()
         self.last_message = (
             "Paused. Breathe, then press Space."
             if self.paused
@@ -1047,6 +1157,8 @@ class SnakeGame(App):
         """Restart the current mode while preserving high score."""
 
         self._reset_game_state(reset_high_score=False)
+        if self._game_timer is not None:
+            self._game_timer.resume()
         self.last_message = "Fresh board. Good luck."
         self._update_display()
 
@@ -1789,38 +1901,14 @@ class KittySnakeGame:
         """Map normalized keys to the shared game direction queue."""
 
         if self.game.two_player:
-            if self.game.alive1:
-                player1_keys = {
-                    "w": Direction.UP,
-                    "s": Direction.DOWN,
-                    "a": Direction.LEFT,
-                    "d": Direction.RIGHT,
-                }
-                if key in player1_keys:
-                    self.game._queue_direction(player1_keys[key], player=1)
-            if self.game.alive2:
-                player2_keys = {
-                    "up": Direction.UP,
-                    "down": Direction.DOWN,
-                    "left": Direction.LEFT,
-                    "right": Direction.RIGHT,
-                }
-                if key in player2_keys:
-                    self.game._queue_direction(player2_keys[key], player=2)
+            if self.game.alive1 and key in PLAYER1_KEYS:
+                self.game._queue_direction(PLAYER1_KEYS[key], player=1)
+            elif self.game.alive2 and key in PLAYER2_KEYS:
+                self.game._queue_direction(PLAYER2_KEYS[key], player=2)
             return
 
-        movement_keys = {
-            "w": Direction.UP,
-            "up": Direction.UP,
-            "s": Direction.DOWN,
-            "down": Direction.DOWN,
-            "a": Direction.LEFT,
-            "left": Direction.LEFT,
-            "d": Direction.RIGHT,
-            "right": Direction.RIGHT,
-        }
-        if key in movement_keys:
-            self.game._queue_direction(movement_keys[key])
+        if key in MOVEMENT_KEYS:
+            self.game._queue_direction(MOVEMENT_KEYS[key])
 
     def _render_frame(self) -> None:
         """Render one Kitty graphics frame plus text HUD."""
@@ -49,6 +49,7 @@ Usage Examples:
     uv run terminal_proxy_ip.py current --format json --verbose
     uv run terminal_proxy_ip.py lookup 8.8.8.8
     uv run terminal_proxy_ip.py lookup 1.1.1.1 --format json --verbose
+    uv run terminal_proxy_ip.py lookup 8.8.8.8 1.1.1.1 9.9.9.9
 
 Use It For:
     - Checking the public IP address seen by ipinfo.io
@@ -64,15 +65,35 @@ Network Notes:
 # WARN: if you have problem, see https://ipinfo.io/missingauth
 
 import click
-import requests
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, Any, Optional
 import json
 
 
+# One session for the whole process so back-to-back lookups reuse the
+# pooled TLS connection instead of paying a fresh handshake per request.
+# Created lazily: importing requests costs tens of milliseconds, which
+# --help and usage-error paths should not pay.
+_SESSION: Optional[Any] = None
+
+
+def _get_session() -> Any:
+    """Return the shared HTTP session, creating it on first use."""
+    global _SESSION
+    if _SESSION is None:
+        import requests
+
+        _SESSION = requests.Session()
+        _SESSION.headers.update({"Accept": "application/json"})
+    return _SESSION
+
+
 def fetch_ip_info(url: str) -> Optional[Dict[str, Any]]:
     """Fetch IP address and location information from ipinfo.io."""
+    import requests
+
     try:
-        response = requests.get(url, timeout=10)
+        response = _get_session().get(url, timeout=10)
         response.raise_for_status()
         return response.json()
     except requests.RequestException as e:
@@ -96,36 +117,50 @@ def parse_location(loc_str: str) -> tuple[str, str]:
         return "Unknown", "Unknown"
 
 
+# Label-to-key pairs for the table view, defined once so both commands
+# render from the same field list.
+_BASIC_FIELDS = (
+    ("IP Address", "ip"),
+    ("City", "city"),
+    ("Region", "region"),
+    ("Country", "country"),
+)
+_VERBOSE_FIELDS = (
+    ("Organization", "org"),
+    ("Timezone", "timezone"),
+    ("Postal Code", "postal"),
+)
+
+
 def echo_ip_info(ip_info: Dict[str, Any], output_format: str, verbose: bool) -> None:
     """Display IP information as JSON or a readable table."""
     if output_format == "json":
         click.echo(json.dumps(ip_info, indent=2, sort_keys=True))
         return
 
-    click.echo(f"IP Address: {ip_info.get('ip', 'Unknown')}")
-    click.echo(f"City: {ip_info.get('city', 'Unknown')}")
-    click.echo(f"Region: {ip_info.get('region', 'Unknown')}")
-    click.echo(f"Country: {ip_info.get('country', 'Unknown')}")
+    # Collect the table into one echo so the terminal gets a single write
+    # instead of one syscall per line.
+    lines = [f"{label}: {ip_info.get(key, 'Unknown')}" for label, key in _BASIC_FIELDS]
 
-    if not verbose:
-        return
+    if verbose:
+        lines.extend(
+            f"{label}: {ip_info.get(key, 'Unknown')}" for label, key in _VERBOSE_FIELDS
+        )
 
-    click.echo(f"Organization: {ip_info.get('org', 'Unknown')}")
-    click.echo(f"Timezone: {ip_info.get('timezone', 'Unknown')}")
-    click.echo(f"Postal Code: {ip_info.get('postal', 'Unknown')}")
+        loc = ip_info.get("loc", "")
+        if loc:
+            lat, lng = parse_location(loc)
+            lines.append(f"Latitude: {lat}")
+            lines.append(f"Longitude: {lng}")
+        else:
+            lines.append("Latitude: Unknown")
+            lines.append("Longitude: Unknown")
 
-    loc = ip_info.get("loc", "")
-    if loc:
-        lat, lng = parse_location(loc)
-        click.echo(f"Latitude: {lat}")
-        click.echo(f"Longitude: {lng}")
-    else:
-        click.echo("Latitude: Unknown")
-        click.echo("Longitude: Unknown")
+        hostname = ip_info.get("hostname")
+        if hostname:
+            lines.append(f"Hostname: {hostname}")
 
-    hostname = ip_info.get("hostname")
-    if hostname:
-        click.echo(f"Hostname: {hostname}")
+    click.echo("\n".join(lines))
 
 
 @click.command()
@@ -146,20 +181,41 @@ def main(format: str, verbose: bool) -> None:
 
 
 @click.command()
-@click.argument("ip_address")
-@click.option("--format", "-f", type=click.Choice(["json", "table"]), default="table", 
+@click.argument("ip_addresses", nargs=-1, required=True)
+@click.option("--format", "-f", type=click.Choice(["json", "table"]), default="table",
               help="Output format (json or table)")
 @click.option("--verbose", "-v", is_flag=True, help="Show detailed information")
-def lookup(ip_address: str, format: str, verbose: bool) -> None:
-    """Look up information for a specific IP address"""
+def lookup(ip_addresses: tuple[str, ...], format: str, verbose: bool) -> None:
+    """Look up information for one or more IP addresses"""
     if format != "json":
-        click.echo(f"Looking up information for IP: {ip_address}")
-    
-    ip_info = fetch_ip_info(f"https://ipinfo.io/{ip_address}/json")
-    if not ip_info:
-        raise click.ClickException("No IP information returned")
+        if len(ip_addresses) == 1:
+            click.echo(f"Looking up information for IP: {ip_addresses[0]}")
+        else:
+            click.echo(
+                f"Looking up information for {len(ip_addresses)} IP addresses"
+            )
+
+    if len(ip_addresses) == 1:
+        results = [fetch_ip_info(f"https://ipinfo.io/{ip_addresses[0]}/json")]
+    else:
+        # The work is pure network wait, so threads overlap the requests
+        # and the whole batch costs roughly one round trip.
+        urls = [f"https://ipinfo.io/{ip_address}/json" for ip_address in ip_addresses]
+        with ThreadPoolExecutor(max_workers=min(8, len(urls))) as executor:
+            results = list(executor.map(lambda url: fetch_ip_info(url), urls))
+
+    for ip_info in results:
+        if not ip_info:
+            raise click.ClickException("No IP information returned")
+
+    if format == "json" and len(results) > 1:
+        click.echo(json.dumps(results, indent=2, sort_keys=True))
+        return
 
-    echo_ip_info(ip_info, format, verbose)
+    for index, ip_info in enumerate(results):
+        if index:
+            click.echo()
+        echo_ip_info(ip_info, format, verbose)
 
 
 @click.group()
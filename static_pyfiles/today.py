@@ -69,8 +69,10 @@ Display Options:
 from __future__ import annotations
 
 import calendar
+import re
 from dataclasses import dataclass
 from datetime import date, datetime
+from functools import lru_cache
 from typing import Iterable
 
 import click
@@ -84,6 +86,14 @@ from rich.text import Text
 
 MONTHS_PER_ROW = 3
 
+# Right-aligned day labels built once; every date cell reuses them instead
+# of re-running an f-string per cell.
+_DAY_LABELS = tuple(f"{day:2}" for day in range(32))
+
+# One month number or an ascending range, validated in a single C-level
+# scan instead of nested splits with try/except per value.
+_MONTH_PART_RE = re.compile(r"\s*(\d+)(?:\s*-\s*(\d+))?\s*")
+
 MONTH_PANEL_STYLE = "#7cc7ff"
 TODAY_STYLE = "bold white on #d75f00"
 CURRENT_MONTH_STYLE = "bold #7dff9b"
@@ -106,41 +116,40 @@ class CalendarSelection:
     current_time: datetime
 
 
-def parse_month_range(month_text: str) -> list[int]:
-    """Parse month input like '1-3' or '1,3,5' into unique month numbers."""
+@lru_cache(maxsize=32)
+def parse_month_range(month_text: str) -> tuple[int, ...]:
+    """Parse month input like '1-3' or '1,3,5' into unique month numbers.
+
+    The result is an immutable tuple so it can be memoized; repeated
+    invocations with the same --month text skip the re-parse.
+    """
 
     months: list[int] = []
 
     for raw_part in month_text.split(","):
-        part = raw_part.strip()
-        if not part:
-            raise click.BadParameter("Month lists cannot contain empty values.")
-
-        if "-" in part:
-            bounds = [value.strip() for value in part.split("-", 1)]
-            try:
-                start, end = (int(value) for value in bounds)
-            except ValueError as error:
-                raise click.BadParameter(
-                    f"Invalid month range format: {part}"
-                ) from error
-            if start > end:
-                raise click.BadParameter(
-                    f"Month range must ascend from low to high: {part}"
-                )
-            months.extend(range(start, end + 1))
-        else:
-            try:
-                months.append(int(part))
-            except ValueError as error:
-                raise click.BadParameter(f"Invalid month: {part}") from error
+        match = _MONTH_PART_RE.fullmatch(raw_part)
+        if match is None:
+            part = raw_part.strip()
+            if not part:
+                raise click.BadParameter("Month lists cannot contain empty values.")
+            if "-" in part:
+                raise click.BadParameter(f"Invalid month range format: {part}")
+            raise click.BadParameter(f"Invalid month: {part}")
+
+        start = int(match[1])
+        end = int(match[2]) if match[2] else start
+        if start > end:
+            raise click.BadParameter(
+                f"Month range must ascend from low to high: {raw_part.strip()}"
+            )
+        months.extend(range(start, end + 1))
 
     unique_months = list(dict.fromkeys(months))
     invalid_months = [month for month in unique_months if not validate_month(month)]
     if invalid_months:
         raise click.BadParameter(f"Invalid months: {invalid_months}")
 
-    return unique_months
+    return tuple(unique_months)
 
 
 def validate_month(month: int) -> bool:
@@ -160,12 +169,28 @@ def resolve_months(
     if show_all:
         return list(range(1, 13))
     if month_text:
-        return parse_month_range(month_text)
+        return list(parse_month_range(month_text))
     if year == today.year:
         return [today.month]
     return [1]
 
 
+@lru_cache(maxsize=64)
+def month_weeks(first_weekday: int, year: int, month: int) -> tuple[tuple[date, ...], ...]:
+    """Return the memoized week grid for one month.
+
+    A full-year render asks for twelve grids with the same first weekday,
+    and repeated CLI-style calls in one process ask for identical months;
+    caching skips the ``calendar.Calendar`` allocation and the datetime
+    math behind ``monthdatescalendar``.
+    """
+
+    month_calendar = calendar.Calendar(first_weekday)
+    return tuple(
+        tuple(week) for week in month_calendar.monthdatescalendar(year, month)
+    )
+
+
 def weekday_labels(first_weekday: int) -> list[str]:
     """Return short weekday labels in the requested order."""
 
@@ -175,6 +200,19 @@ def weekday_labels(first_weekday: int) -> list[str]:
     return labels
 
 
+@lru_cache(maxsize=4)
+def weekday_header_cells(first_weekday: int) -> tuple[Text, ...]:
+    """Return the styled weekday header row, built once per ordering."""
+
+    return tuple(
+        Text(
+            label,
+            style=HEADER_STYLE if label not in {"Sa", "Su"} else WEEKEND_STYLE,
+        )
+        for label in weekday_labels(first_weekday)
+    )
+
+
 def is_weekend(day: date) -> bool:
     """Return whether a date falls on a Saturday or Sunday."""
 
@@ -185,18 +223,19 @@ def date_cell(
     day: date,
     target_year: int,
     target_month: int,
-    today: date,
-    highlight_today: bool,
+    today: date | None,
 ) -> Text:
-    """Build a styled date cell for the month grid."""
+    """Build a styled date cell for the month grid.
+
+    ``today`` is only passed for the one month that can actually contain
+    it, so the other months skip the highlight comparison entirely.
+    """
 
-    is_current_month = day.year == target_year and day.month == target_month
-    is_today = is_current_month and day == today
-    label = f"{day.day:2}"
+    label = _DAY_LABELS[day.day]
 
-    if highlight_today and is_today:
+    if day == today:
         return Text(label, style=TODAY_STYLE)
-    if not is_current_month:
+    if day.year != target_year or day.month != target_month:
         return Text(label, style=ADJACENT_MONTH_STYLE)
     if is_weekend(day):
         return Text(label, style=WEEKEND_STYLE)
@@ -206,45 +245,31 @@ def date_cell(
 def build_month_panel(selection: CalendarSelection, month: int) -> Panel:
     """Render one month as a compact Rich panel."""
 
-    month_calendar = calendar.Calendar(selection.first_weekday)
-    weeks = month_calendar.monthdatescalendar(selection.year, month)
+    weeks = month_weeks(selection.first_weekday, selection.year, month)
+
+    cell_today = (
+        selection.today
+        if (
+            selection.highlight_today
+            and selection.today.year == selection.year
+            and selection.today.month == month
+        )
+        else None
+    )
 
     table = Table.grid(padding=(0, 1))
     for _ in range(7):
         table.add_column(justify="center", width=2)
 
-    table.add_row(
-        *[
-            Text(
-                label,
-                style=HEADER_STYLE if label not in {"Sa", "Su"} else WEEKEND_STYLE,
-            )
-            for label in weekday_labels(selection.first_weekday)
-        ]
-    )
+    table.add_row(*weekday_header_cells(selection.first_weekday))
 
     for week in weeks:
         table.add_row(
-            *[
-                date_cell(
-                    day,
-                    selection.year,
-                    month,
-                    selection.today,
-                    selection.highlight_today,
-                )
-                for day in week
-            ]
+            *[date_cell(day, selection.year, month, cell_today) for day in week]
         )
 
     month_name = calendar.month_name[month]
-    subtitle = ""
-    if (
-        selection.highlight_today
-        and selection.today.year == selection.year
-        and selection.today.month == month
-    ):
-        subtitle = f"today {selection.today.day}"
+    subtitle = f"today {cell_today.day}" if cell_today else ""
 
     return Panel.fit(
         table,
@@ -98,6 +98,57 @@ class RouteSmokeTests(unittest.TestCase):
             self.assertIn(f"https://uvpy.run/detail/{script_name}", locs)
             self.assertNotIn(f"https://uvpy.run/{script_name}.py", locs)
 
+    def test_homepage_etag_supports_conditional_requests(self):
+        first = self.client.get("/", headers={"Host": "localhost:9999"})
+        etag = first.headers.get("ETag")
+
+        self.assertEqual(first.status_code, 200)
+        self.assertIsNotNone(etag)
+
+        revisit = self.client.get(
+            "/",
+            headers={"Host": "localhost:9999", "If-None-Match": etag},
+        )
+
+        self.assertEqual(revisit.status_code, 304)
+        self.assertEqual(revisit.data, b"")
+
+        tool_path = os.path.join(main.STATIC_PYFILES_ROOT, "passwordgen.py")
+        original = os.stat(tool_path)
+        try:
+            os.utime(
+                tool_path,
+                ns=(original.st_atime_ns, original.st_mtime_ns + 1),
+            )
+            changed = self.client.get(
+                "/",
+                headers={"Host": "localhost:9999", "If-None-Match": etag},
+            )
+        finally:
+            os.utime(
+                tool_path,
+                ns=(original.st_atime_ns, original.st_mtime_ns),
+            )
+
+        self.assertEqual(changed.status_code, 200)
+        self.assertNotEqual(changed.headers.get("ETag"), etag)
+        self.assertIn(b"passwordgen.py", changed.data)
+
+    def test_catalog_etag_tolerates_vanished_tool_files(self):
+        ghost = os.path.join(main.STATIC_PYFILES_ROOT, "does_not_exist.py")
+        tools = [
+            ("passwordgen.py", os.path.join(main.STATIC_PYFILES_ROOT, "passwordgen.py")),
+            ("does_not_exist.py", ghost),
+        ]
+
+        etag = main.tool_catalog_etag(tools, "https://uvpy.run")
+
+        self.assertTrue(etag)
+        self.assertNotEqual(
+            etag,
+            main.tool_catalog_etag(tools[:1], "https://uvpy.run"),
+        )
+
     def test_homepage_uses_canonical_url_for_social_metadata(self):
         response = self.client.get("/", headers={"Host": "uvpy.run"})
 
@@ -659,6 +659,182 @@ class ToolRiskCoherenceTests(unittest.TestCase):
             self.assertIn("dry run", result.stdout)
             self.assertIn("terminal preview", result.stdout)
 
+    def test_qr_batch_generates_numbered_pngs(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            batch_path = Path(tmp) / "links.txt"
+            batch_path.write_text(
+                "https://uvpy.run\n\nhttps://uvpy.run/qr.py\n   \nhello batch\n",
+                encoding="utf-8",
+            )
+            output_path = Path(tmp) / "codes.png"
+
+            result = subprocess.run(
+                [
+                    sys.executable,
+                    str(STATIC_PYFILES_ROOT / "qr.py"),
+                    "--batch",
+                    str(batch_path),
+                    "--output",
+                    str(output_path),
+                    "--size",
+                    "2",
+                    "--border",
+                    "1",
+                ],
+                cwd=PROJECT_ROOT,
+                capture_output=True,
+                text=True,
+                timeout=60,
+            )
+
+            self.assertEqual(result.returncode, 0, result.stdout + result.stderr)
+            self.assertIn("batch PNGs generated", result.stdout)
+            for index in (1, 2, 3):
+                target = Path(tmp) / f"codes_{index}.png"
+                self.assertTrue(target.is_file())
+                self.assertTrue(target.read_bytes().startswith(b"\x89PNG\r\n\x1a\n"))
+            self.assertFalse((Path(tmp) / "codes_4.png").exists())
+            self.assertFalse(output_path.exists())
+
+    def test_qr_batch_refuses_existing_target_without_force(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            batch_path = Path(tmp) / "links.txt"
+            batch_path.write_text(
+                "https://uvpy.run\nhttps://uvpy.run/qr.py\n",
+                encoding="utf-8",
+            )
+            existing_target = Path(tmp) / "codes_2.png"
+            existing_target.write_text("existing", encoding="utf-8")
+
+            result = subprocess.run(
+                [
+                    sys.executable,
+                    str(STATIC_PYFILES_ROOT / "qr.py"),
+                    "--batch",
+                    str(batch_path),
+                    "--output",
+                    str(Path(tmp) / "codes.png"),
+                ],
+                cwd=PROJECT_ROOT,
+                capture_output=True,
+                text=True,
+                timeout=20,
+            )
+
+            self.assertNotEqual(result.returncode, 0)
+            self.assertIn("already exists", result.stderr)
+            self.assertEqual(existing_target.read_text(encoding="utf-8"), "existing")
+            self.assertFalse((Path(tmp) / "codes_1.png").exists())
+
+    def test_qr_batch_dry_run_does_not_write_files(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            batch_path = Path(tmp) / "links.txt"
+            batch_path.write_text(
+                "https://uvpy.run\nhello batch\n",
+                encoding="utf-8",
+            )
+            output_dir = Path(tmp) / "nested"
+
+            result = subprocess.run(
+                [
+                    sys.executable,
+                    str(STATIC_PYFILES_ROOT / "qr.py"),
+                    "--batch",
+                    str(batch_path),
+                    "--output",
+                    str(output_dir / "codes.png"),
+                    "--dry-run",
+                ],
+                cwd=PROJECT_ROOT,
+                capture_output=True,
+                text=True,
+                timeout=20,
+            )
+
+            self.assertEqual(result.returncode, 0, result.stdout + result.stderr)
+            self.assertIn("batch dry run", result.stdout)
+            self.assertFalse(output_dir.exists())
+
+    def test_qr_svg_format_writes_vector_output(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            output_path = Path(tmp) / "vector.svg"
+            result = subprocess.run(
+                [
+                    sys.executable,
+                    str(STATIC_PYFILES_ROOT / "qr.py"),
+                    "https://uvpy.run",
+                    "--output",
+                    str(output_path),
+                    "--format",
+                    "svg",
+                    "--no-terminal",
+                ],
+                cwd=PROJECT_ROOT,
+                capture_output=True,
+                text=True,
+                timeout=20,
+            )
+
+            self.assertEqual(result.returncode, 0, result.stdout + result.stderr)
+            self.assertTrue(output_path.is_file())
+            content = output_path.read_text(encoding="utf-8")
+            self.assertIn("<svg", content)
+            self.assertIn("path", content)
+            self.assertIn("SVG generated", result.stdout)
+
+    def test_qr_svg_format_defaults_to_svg_output_name(self):
+        result = subprocess.run(
+            [
+                sys.executable,
+                str(STATIC_PYFILES_ROOT / "qr.py"),
+                "https://uvpy.run",
+                "--format",
+                "svg",
+                "--dry-run",
+                "--no-terminal",
+            ],
+            cwd=PROJECT_ROOT,
+            capture_output=True,
+            text=True,
+            timeout=20,
+        )
+
+        self.assertEqual(result.returncode, 0, result.stdout + result.stderr)
+        self.assertIn("qrcode.svg", result.stdout)
+        self.assertFalse((PROJECT_ROOT / "qrcode.svg").exists())
+
+    def test_qr_svg_format_rejects_incompatible_options(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            batch_path = Path(tmp) / "links.txt"
+            batch_path.write_text("https://uvpy.run\n", encoding="utf-8")
+
+            cases = [
+                (["--batch", str(batch_path)], "not supported with --batch"),
+                (["--style", "rounded"], "only supports the square style"),
+            ]
+            for extra_args, expected_error in cases:
+                with self.subTest(extra_args=extra_args):
+                    argv = [
+                        sys.executable,
+                        str(STATIC_PYFILES_ROOT / "qr.py"),
+                        "--format",
+                        "svg",
+                    ]
+                    if "--batch" not in extra_args:
+                        argv.append("https://uvpy.run")
+                    argv.extend(extra_args)
+
+                    result = subprocess.run(
+                        argv,
+                        cwd=PROJECT_ROOT,
+                        capture_output=True,
+                        text=True,
+                        timeout=20,
+                    )
+
+                    self.assertNotEqual(result.returncode, 0)
+                    self.assertIn(expected_error, result.stderr)
+
     def test_breakout_arcade_tuning_stays_lightweight(self):
         tool = load_tool_module("brick.py")
 
@@ -859,6 +1035,47 @@ class ToolRiskCoherenceTests(unittest.TestCase):
         self.assertNotEqual(missing_argument.exit_code, 0)
         self.assertIn("Missing argument", missing_argument.output)
 
+    def test_terminal_proxy_ip_lookup_handles_multiple_addresses(self):
+        tool = load_tool_module("terminal_proxy_ip.py")
+        payloads = {
+            "https://ipinfo.io/8.8.8.8/json": {
+                "ip": "8.8.8.8",
+                "city": "First City",
+                "region": "First Region",
+                "country": "AA",
+            },
+            "https://ipinfo.io/1.1.1.1/json": {
+                "ip": "1.1.1.1",
+                "city": "Second City",
+                "region": "Second Region",
+                "country": "BB",
+            },
+        }
+        tool.fetch_ip_info = lambda url: payloads[url]
+        runner = CliRunner()
+
+        table = runner.invoke(tool.lookup, ["8.8.8.8", "1.1.1.1"])
+        self.assertEqual(table.exit_code, 0, table.output)
+        self.assertIn("2 IP addresses", table.output)
+        self.assertIn(
+            "Country: AA\n\nIP Address: 1.1.1.1",
+            table.output,
+        )
+
+        as_json = runner.invoke(
+            tool.lookup, ["8.8.8.8", "1.1.1.1", "--format", "json"]
+        )
+        self.assertEqual(as_json.exit_code, 0, as_json.output)
+        parsed = json.loads(as_json.output)
+        self.assertIsInstance(parsed, list)
+        self.assertEqual([entry["ip"] for entry in parsed], ["8.8.8.8", "1.1.1.1"])
+
+        single = runner.invoke(tool.lookup, ["8.8.8.8", "--format", "json"])
+        self.assertEqual(single.exit_code, 0, single.output)
+        self.assertEqual(
+            json.loads(single.output), payloads["https://ipinfo.io/8.8.8.8/json"]
+        )
+
     def test_image_tool_metadata_covers_single_and_batch_workflows(self):
         image_tool = parse_tool_metadata(STATIC_PYFILES_ROOT / "image.py").to_dict()
 
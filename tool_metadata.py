@@ -6,6 +6,34 @@ from datetime import datetime
 
 SOURCE_PREVIEW_LINES = 120
 
+# Docstrings and PEP 723 blocks live at the top of a tool file, so the
+# metadata pass only needs the header, not the whole script.
+METADATA_HEADER_CHARS = 8192
+
+# Chunk size for counting lines past the preview without building a str
+# object per line.
+TAIL_COUNT_CHARS = 65536
+
+# Parsed metadata cache: path -> ((mtime_ns, size), ToolMetadata).
+# Tool files rarely change, so repeat requests skip the read+parse entirely.
+_METADATA_CACHE = {}
+
+# Single-pass extraction patterns; these replace line-by-line state machines.
+_DOCSTRING_RE = re.compile(r'"""(.*?)(?:"""|\Z)', re.DOTALL)
+_META_FIELD_RE = re.compile(r"^(Version|Category|Author):\s*(.+)$", re.MULTILINE)
+_SCRIPT_BLOCK_RE = re.compile(
+    r"^# /// script\s*\n(.*?)^# ///\s*$",
+    re.DOTALL | re.MULTILINE,
+)
+_REQUIRES_PYTHON_RE = re.compile(r'^#\s*requires-python\s*=\s*"([^"]*)"', re.MULTILINE)
+# The closing bracket must sit at end of line so "qrcode[pil]" style
+# extras inside the list do not terminate the match early.
+_DEPENDENCIES_RE = re.compile(
+    r"^#\s*dependencies\s*=\s*\[(.*?)\]\s*$",
+    re.DOTALL | re.MULTILINE,
+)
+_QUOTED_VALUE_RE = re.compile(r'"([^"]*)"')
+
 
 @dataclass
 class DocSection:
@@ -37,43 +65,81 @@ class ToolMetadata:
         return asdict(self)
 
 
-def parse_tool_metadata(file_path):
-    """Parse display metadata from a public Python tool file."""
+def parse_tool_metadata(file_path, file_stat=None):
+    """Parse display metadata from a public Python tool file.
+
+    Results are cached keyed by (mtime, size) so unchanged files are not
+    re-read on every request. Callers that already hold a stat result
+    (e.g. from os.scandir) can pass it to avoid a second syscall.
+    """
+    file_path = os.fspath(file_path)
     filename = os.path.basename(file_path)
 
     try:
-        with open(file_path, "r", encoding="utf-8") as file:
-            content = file.read()
+        if file_stat is None:
+            file_stat = os.stat(file_path)
+        cache_key = (file_stat.st_mtime_ns, file_stat.st_size)
+        cached = _METADATA_CACHE.get(file_path)
+        if cached is not None and cached[0] == cache_key:
+            return cached[1]
 
-        source_lines = content.splitlines()
-        lines = content.split("\n")
-        docstring_lines = extract_module_docstring_lines(lines)
-        requires_python, dependencies = parse_pep723_metadata(lines)
+        with open(file_path, "r", encoding="utf-8") as file:
+            header = file.read(METADATA_HEADER_CHARS)
+            source_lines = header.splitlines()
+            line_count = len(source_lines)
+            if len(header) == METADATA_HEADER_CHARS:
+                # The cap may have cut a line in half; finish it, then
+                # complete the preview line by line.
+                if source_lines and not header.endswith("\n"):
+                    source_lines[-1] += file.readline().rstrip("\n")
+                while len(source_lines) < SOURCE_PREVIEW_LINES:
+                    line = file.readline()
+                    if not line:
+                        break
+                    line_count += 1
+                    source_lines.append(line.rstrip("\n"))
+                else:
+                    # Preview is full; count the remaining lines in bulk
+                    # chunks instead of allocating a str per line.
+                    trailing_text = False
+                    chunk = file.read(TAIL_COUNT_CHARS)
+                    while chunk:
+                        line_count += chunk.count("\n")
+                        trailing_text = not chunk.endswith("\n")
+                        chunk = file.read(TAIL_COUNT_CHARS)
+                    if trailing_text:
+                        line_count += 1
+
+        docstring_lines = extract_module_docstring_lines(header)
+        requires_python, dependencies = parse_pep723_metadata(header)
         title, description, full_docstring, overview, sections, usage_examples = (
             parse_docstring_metadata(filename, docstring_lines)
         )
+        meta_fields = dict(_META_FIELD_RE.findall(full_docstring))
 
-        return ToolMetadata(
+        metadata = ToolMetadata(
             filename=filename,
             title=title,
             description=description,
             overview=overview,
             doc_sections=sections,
-            version=parse_docstring_field(docstring_lines, "Version") or "N/A",
-            category=parse_docstring_field(docstring_lines, "Category") or "N/A",
-            author=parse_docstring_field(docstring_lines, "Author") or "N/A",
+            version=meta_fields.get("Version") or "N/A",
+            category=meta_fields.get("Category") or "N/A",
+            author=meta_fields.get("Author") or "N/A",
             requires_python=requires_python,
             dependencies=dependencies,
             usage_examples=usage_examples,
             remote_usage_examples=[],
             full_docstring=full_docstring,
-            source_lines=len(source_lines),
-            updated_at=datetime.fromtimestamp(os.path.getmtime(file_path)).strftime(
+            source_lines=line_count,
+            updated_at=datetime.fromtimestamp(file_stat.st_mtime).strftime(
                 "%Y-%m-%d"
             ),
             source_preview="\n".join(source_lines[:SOURCE_PREVIEW_LINES]),
-            source_preview_truncated=len(source_lines) > SOURCE_PREVIEW_LINES,
+            source_preview_truncated=line_count > SOURCE_PREVIEW_LINES,
         )
+        _METADATA_CACHE[file_path] = (cache_key, metadata)
+        return metadata
     except Exception as error:
         return fallback_metadata(filename, f"Error reading file: {error}")
 
@@ -100,76 +166,35 @@ def fallback_metadata(filename, full_docstring=""):
     )
 
 
-def parse_pep723_metadata(lines):
-    requires_python = "N/A"
-    dependencies = []
-    in_script_block = False
-    in_dependencies = False
-
-    for line in lines:
-        stripped = line.strip()
-
-        if stripped == "# /// script":
-            in_script_block = True
-            continue
-        if stripped == "# ///":
-            in_script_block = False
-            in_dependencies = False
-            break
-        if not in_script_block:
-            continue
+def parse_pep723_metadata(content):
+    """Extract requires-python and dependencies from the PEP 723 block."""
+    block_match = _SCRIPT_BLOCK_RE.search(content)
+    if block_match is None:
+        return "N/A", []
 
-        if stripped.startswith("# requires-python ="):
-            requires_python_match = re.search(r'"([^"]*)"', stripped)
-            if requires_python_match:
-                requires_python = requires_python_match.group(1)
-
-        if stripped.startswith("# dependencies = ["):
-            in_dependencies = True
-            deps_content = stripped[len("# dependencies = [") :]
-            dependencies.extend(re.findall(r'"([^"]*)"', deps_content))
-            if stripped.endswith("]"):
-                in_dependencies = False
-            continue
+    block = block_match.group(1)
+    requires_python_match = _REQUIRES_PYTHON_RE.search(block)
+    requires_python = (
+        requires_python_match.group(1) if requires_python_match else "N/A"
+    )
 
-        if in_dependencies:
-            dependencies.extend(re.findall(r'"([^"]*)"', stripped))
-            if stripped.endswith("]"):
-                in_dependencies = False
+    dependencies_match = _DEPENDENCIES_RE.search(block)
+    dependencies = (
+        _QUOTED_VALUE_RE.findall(dependencies_match.group(1))
+        if dependencies_match
+        else []
+    )
 
     return requires_python, dependencies
 
 
-def extract_module_docstring_lines(lines):
-    in_docstring = False
-    docstring_lines = []
+def extract_module_docstring_lines(content):
+    """Return stripped, non-empty lines from the first triple-quoted block."""
+    match = _DOCSTRING_RE.search(content)
+    if match is None:
+        return []
 
-    for line in lines:
-        stripped = line.strip()
-
-        if '"""' in stripped and not in_docstring:
-            in_docstring = True
-            if stripped.count('"""') == 2:
-                docstring_content = stripped.split('"""')[1].strip()
-                if docstring_content:
-                    docstring_lines.append(docstring_content)
-                break
-
-            after_quotes = stripped.split('"""', 1)[1].strip()
-            if after_quotes:
-                docstring_lines.append(after_quotes)
-            continue
-
-        if in_docstring:
-            if '"""' in stripped:
-                before_quotes = stripped.split('"""')[0].strip()
-                if before_quotes:
-                    docstring_lines.append(before_quotes)
-                break
-            if stripped:
-                docstring_lines.append(stripped)
-
-    return docstring_lines
+    return [line.strip() for line in match.group(1).splitlines() if line.strip()]
 
 
 def parse_docstring_metadata(filename, docstring_lines):
@@ -198,32 +223,23 @@ def summarize_description(overview, fallback, limit=160):
     return source[:limit] + ("..." if len(source) > limit else "")
 
 
-def parse_docstring_field(docstring_lines, field_name):
-    prefix = f"{field_name}:"
-
-    for line in docstring_lines:
-        stripped = line.strip()
-        if stripped.startswith(prefix):
-            return stripped.split(prefix, 1)[1].strip()
-
-    return None
-
-
 def parse_usage_examples(docstring_lines, filename):
     usage_examples = []
     collecting_examples = False
+    # Unbound-method alias avoids the per-line attribute lookup
+    startswith = str.startswith
 
     for line in docstring_lines:
         stripped = line.strip()
 
-        if stripped.startswith(("Usage Examples:", "Examples:")):
+        if startswith(stripped, ("Usage Examples:", "Examples:")):
             collecting_examples = True
             continue
 
         if not collecting_examples:
             continue
 
-        if stripped.startswith(("uv run ", "python ")):
+        if startswith(stripped, ("uv run ", "python ")):
             usage_examples.append(normalize_usage_example(stripped, filename))
 
     return usage_examples